@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Per call cost of the checks in :mod:`dpytools.checks` before and after compiling their arguments
+
+The "before" predicates are the implementations of dpytools 0.18.0b, they validate their arguments,
+read `guild_permissions` and resolve role names on every call.
+The guild has 250 roles and the member 20 of them, none of the checks pass through the admin shortcut.
+
+Usage::
+
+    python benchmarks/checks.py [iterations]
+"""
+import asyncio
+import os
+import sys
+import time
+import types
+
+from discord import Permissions, utils
+from discord.ext import commands
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # run from a checkout
+
+from dpytools import checks
+
+
+class Role:
+    def __init__(self, guild, role_id: int, name: str, position: int, permissions: int):
+        self.guild = guild
+        self.id = role_id
+        self.name = name
+        self.position = position
+        self.permissions = Permissions(permissions)
+
+    def __ge__(self, other):
+        return self.position >= other.position
+
+
+class Guild:
+    def __init__(self, roles: int):
+        self.id = 1
+        self.name = 'benchmark'
+        self.roles = [Role(self, i, f'role {i}', i, 1 << (i % 30) if i % 7 else 0) for i in range(1, roles + 1)]
+        self._roles = {role.id: role for role in self.roles}
+
+    def get_role(self, role_id: int):
+        return self._roles.get(role_id)
+
+
+class Bot:
+    def add_listener(self, func, name):
+        pass
+
+
+class Member:
+    """Computes guild_permissions walking its roles like discord.py"""
+
+    def __init__(self, guild: Guild, role_ids):
+        self.id = 42
+        self.guild = guild
+        self._roles = list(role_ids)
+
+    @property
+    def roles(self):
+        return sorted((self.guild.get_role(i) for i in self._roles), key=lambda r: r.position)
+
+    @property
+    def top_role(self):
+        return self.roles[-1]
+
+    @property
+    def guild_permissions(self):
+        value = 0
+        for role in self.roles:
+            value |= role.permissions.value
+        return Permissions(value)
+
+
+def before_admin_or_roles(*roles):
+    async def predicate(ctx):
+        if not all(type(r) in [int, str] for r in roles):
+            raise TypeError('Roles must be type int or str')
+        if ctx.guild is None:
+            raise commands.NoPrivateMessage()
+        if ctx.author.guild_permissions.administrator is True:
+            return True
+        discord_roles = []
+        for role in roles:
+            if isinstance(role, str):
+                discord_roles.append(utils.get(ctx.guild.roles, name=role))
+            elif isinstance(role, int):
+                discord_roles.append(ctx.guild.get_role(role))
+        if any([role for role in discord_roles if role and role in ctx.author.roles]):
+            return True
+        raise commands.MissingPermissions("User doesn't have admin permissions or specified roles")
+    return predicate
+
+
+def before_any_of_permissions(**permissions):
+    async def predicate(ctx):
+        if invalid := (set(permissions) - set(Permissions.VALID_FLAGS)):
+            raise TypeError('Invalid permission(s): %s' % (', '.join(invalid)))
+        elif ctx.guild is None:
+            raise commands.NoPrivateMessage("Command was called from a direct message.")
+        author_perms = ctx.author.guild_permissions
+        matched = [k for k, v in permissions.items() if getattr(author_perms, k) == v]
+        if any(matched):
+            return True
+        raise commands.MissingPermissions("'You are missing one or more permission(s) to run this command.")
+    return predicate
+
+
+def before_only_these_users(*users):
+    def predicate(ctx):
+        return ctx.author.id in users
+    return predicate
+
+
+def after(check_factory, *args, **kwargs):
+    async def command(ctx):
+        pass
+    return check_factory(*args, **kwargs)(command).__commands_checks__[-1]
+
+
+async def measure(predicate, new_ctx, iterations: int) -> float:
+    """A new context per call like a real invocation, so memoization on the context doesn't skew the results"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        try:
+            result = predicate(new_ctx())
+            if asyncio.iscoroutine(result):
+                await result
+        except commands.CheckFailure:
+            pass
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def run(iterations: int):
+    guild = Guild(250)
+    member = Member(guild, range(100, 120))
+    bot = Bot()
+
+    def new_ctx():
+        return types.SimpleNamespace(bot=bot, guild=guild, author=member)
+
+    users = list(range(1000, 1200)) + [42]
+    cases = [
+        ('admin_or_roles by name', before_admin_or_roles('role 240', 'role 119'),
+         after(checks.admin_or_roles, 'role 240', 'role 119')),
+        ('admin_or_roles by id', before_admin_or_roles(240, 119),
+         after(checks.admin_or_roles, 240, 119)),
+        ('any_of_permissions', before_any_of_permissions(manage_guild=True, ban_members=True, manage_messages=True),
+         after(checks.any_of_permissions, manage_guild=True, ban_members=True, manage_messages=True)),
+        ('only_these_users', before_only_these_users(*users), after(checks.only_these_users, *users)),
+    ]
+    print(f"{'check':<24}{'before (us)':>12}{'after (us)':>12}{'speedup':>9}")
+    for name, before, compiled in cases:
+        b = await measure(before, new_ctx, iterations)
+        a = await measure(compiled, new_ctx, iterations)
+        print(f"{name:<24}{b:>12.2f}{a:>12.2f}{b / a:>8.1f}x")
+
+
+if __name__ == '__main__':
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000))
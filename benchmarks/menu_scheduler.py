@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Offline benchmark of menu REST traffic with and without :class:`dpytools.scheduler.RESTScheduler`
+
+Simulates many arrow menus opened at once in the same channel against :class:`dpytools.scheduler.FakeHTTP`.
+Each menu sends its message, adds its reactions and turns a few pages.
+The direct run retries on 429 after the advertised delay, which is what discord.py does internally.
+
+Usage::
+
+    python benchmarks/menu_scheduler.py [menus] [page_turns]
+"""
+import asyncio
+import os
+import sys
+import time
+
+import discord
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # run from a checkout
+
+from dpytools.scheduler import FakeHTTP, RESTScheduler
+
+REACTIONS = ['⏮️', '◀️', '▶️', '⏭️', '⏸️', '❌']
+
+
+async def _retry(call, *args, **kwargs):
+    while True:
+        try:
+            return await call(*args, **kwargs)
+        except discord.HTTPException as error:
+            if error.status != 429:
+                raise
+            await asyncio.sleep(float(error.response.headers['Retry-After']))
+
+
+async def direct_menu(channel, page_turns: int):
+    msg = await _retry(channel.send, content='page 0')
+    for emoji in REACTIONS:
+        await _retry(msg.add_reaction, emoji)
+    for page in range(1, page_turns + 1):
+        await _retry(msg.edit, content=f'page {page}')
+        await _retry(msg.remove_reaction, '▶️', discord.Object(id=1))
+
+
+async def scheduled_menu(scheduler: RESTScheduler, channel, page_turns: int):
+    msg = await scheduler.send(channel, content='page 0')
+    seeding = asyncio.gather(*(scheduler.add_reaction(msg, emoji) for emoji in REACTIONS))
+    for page in range(1, page_turns + 1):
+        await scheduler.edit(msg, content=f'page {page}')
+        asyncio.ensure_future(scheduler.remove_reaction(msg, '▶️', discord.Object(id=1)))
+    await seeding
+
+
+async def run(menus: int, page_turns: int):
+    for name in ('direct', 'scheduled'):
+        http = FakeHTTP(latency=0.05)
+        channel = http.channel()
+        scheduler = RESTScheduler()
+        start = time.perf_counter()
+        if name == 'direct':
+            await asyncio.gather(*(direct_menu(channel, page_turns) for _ in range(menus)))
+        else:
+            await asyncio.gather(*(scheduled_menu(scheduler, channel, page_turns) for _ in range(menus)))
+            while len(scheduler):
+                await asyncio.sleep(0.05)
+        elapsed = time.perf_counter() - start
+        dropped = scheduler.dropped if name == 'scheduled' else 'N/A'  # only the scheduler merges or drops edits
+        print(f"{name:>10}: {elapsed:7.2f}s  requests={http.requests:<5} 429s={http.rate_limited:<5} "
+              f"dropped={dropped}")
+
+
+if __name__ == '__main__':
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 10,
+                    int(sys.argv[2]) if len(sys.argv) > 2 else 5))
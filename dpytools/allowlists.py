@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+Sets of ids that can change while the bot runs, for :func:`dpytools.checks.only_these_users`
+and :func:`dpytools.checks.in_these_channels`.
+
+Every list keeps its ids in a frozenset that's replaced as a whole on each update,
+so a check either sees the old ids or the new ones and membership is a single hash lookup.
+A single list can be shared by any amount of commands.
+"""
+
+import asyncio
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+__all__ = (
+    'AllowList',
+    'FileAllowList',
+    'SQLiteAllowList',
+)
+
+
+class AllowList:
+    """
+    In memory allowlist
+
+    Parameters
+    ----------
+    ids: :class:`Iterable[int]`
+        The initial ids
+
+    Example
+    -------
+    ::
+
+        from dpytools.allowlists import AllowList
+        from dpytools.checks import only_these_users
+
+        testers = AllowList([123456789012345678])
+
+        @only_these_users(testers)
+        @bot.command()
+        async def beta(ctx):
+            ...
+
+        testers.add(876543210987654321)
+    """
+
+    def __init__(self, ids: Iterable[int] = ()):
+        self._ids = frozenset(ids)
+
+    def __contains__(self, item: int) -> bool:
+        return item in self._ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    @property
+    def ids(self) -> frozenset:
+        """The current ids"""
+        return self._ids
+
+    def replace(self, ids: Iterable[int]):
+        """Replaces every id at once"""
+        self._ids = frozenset(ids)
+
+    def add(self, *ids: int):
+        """Adds ids. Copies the set, use :meth:`replace` for large updates"""
+        self._ids = self._ids.union(ids)
+
+    def remove(self, *ids: int):
+        """Removes ids if present. Copies the set, use :meth:`replace` for large updates"""
+        self._ids = self._ids.difference(ids)
+
+
+class _PollingAllowList(AllowList, ABC):
+    """Base of the allowlists that reload from a source, this class is not intended to be instantiated"""
+
+    def __init__(self, interval: float):
+        super().__init__()
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self.reload()
+
+    @abstractmethod
+    def _changed(self) -> bool:
+        """Whether the source changed since the last read, runs in a thread"""
+
+    @abstractmethod
+    def _read(self) -> Iterable[int]:
+        """Reads every id of the source, runs in a thread"""
+
+    def reload(self):
+        """Reads the source now, blocking"""
+        self.replace(self._read())
+
+    async def poll(self):
+        """Reloads the source in a thread if it changed"""
+        loop = asyncio.get_running_loop()
+        if await loop.run_in_executor(None, self._changed):
+            self.replace(await loop.run_in_executor(None, self._read))
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.poll()
+            except Exception as error:
+                asyncio.get_running_loop().call_exception_handler({
+                    'message': f'Failed to reload {self!r}',
+                    'exception': error,
+                })
+
+    def start(self) -> asyncio.Task:
+        """
+        Starts polling the source every **interval** seconds, it must be called from a running event loop
+
+        Raises
+        ------
+        RuntimeError
+            If the list was closed.
+        """
+        if self._closed:
+            raise RuntimeError(f'{self!r} is closed')
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        return self._task
+
+    def stop(self):
+        """Stops polling, it can be started again"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def close(self):
+        """Stops polling and releases the source, the list keeps its current ids but can't be started again"""
+        self.stop()
+        self._closed = True
+
+
+class FileAllowList(_PollingAllowList):
+    """
+    Allowlist read from a text file with an id per line. Empty lines and lines starting with # are ignored.
+
+    The file is read when the list is created and, after calling :meth:`start`,
+    again every time its modification time changes.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the file
+    interval: :class:`float` (seconds)
+        How often the modification time is checked
+    """
+
+    def __init__(self, path: str, interval: float = 30):
+        self.path = path
+        self._mtime = None
+        super().__init__(interval)
+
+    def _changed(self) -> bool:
+        try:
+            return os.stat(self.path).st_mtime_ns != self._mtime
+        except FileNotFoundError:
+            return False
+
+    def _read(self) -> Iterable[int]:
+        mtime = os.stat(self.path).st_mtime_ns
+        with open(self.path, encoding='utf-8') as file:
+            ids = [int(line) for line in map(str.strip, file) if line and not line.startswith('#')]
+        self._mtime = mtime
+        return ids
+
+    def __repr__(self):
+        return f"FileAllowList(path={self.path!r}, ids={len(self)})"
+
+
+class SQLiteAllowList(_PollingAllowList):
+    """
+    Allowlist read from a sqlite database.
+
+    The query runs when the list is created and, after calling :meth:`start`,
+    again when `PRAGMA data_version` reports that another connection changed the database.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the database
+    query: :class:`str`
+        A query whose first column are the ids, for example `'SELECT user_id FROM testers'`
+    interval: :class:`float` (seconds)
+        How often the database is checked for changes
+    """
+
+    def __init__(self, path: str, query: str, interval: float = 30):
+        self.path = path
+        self.query = query
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._version = None
+        super().__init__(interval)
+
+    def _data_version(self) -> int:
+        return self._connection.execute('PRAGMA data_version').fetchone()[0]
+
+    def _changed(self) -> bool:
+        return self._data_version() != self._version
+
+    def _read(self) -> Iterable[int]:
+        self._version = self._data_version()
+        return [row[0] for row in self._connection.execute(self.query)]
+
+    def close(self):
+        """Stops polling and closes the connection"""
+        super().close()
+        self._connection.close()
+
+    def __repr__(self):
+        return f"SQLiteAllowList(path={self.path!r}, ids={len(self)})"
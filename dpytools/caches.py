@@ -0,0 +1,531 @@
+# -*- coding: utf-8 -*-
+"""
+Caches shared by the checks in :mod:`dpytools.checks`.
+
+`member.guild_permissions` walks every role of the member each time it's read
+and resolving a role by name scans the whole role list of the guild.
+The caches in this module keep the results per member and per guild,
+and drop them when the gateway reports a change that affects them.
+"""
+
+import asyncio
+import itertools
+import time
+import weakref
+from typing import Dict, FrozenSet, Optional, Set, Tuple
+
+import discord
+from discord.ext import commands
+
+__all__ = (
+    'PermissionCache',
+    'MemberPermissions',
+    'MemberResolver',
+    'InvalidationClock',
+)
+
+_ADMINISTRATOR = discord.Permissions(administrator=True).value
+
+
+def _roles_key(member: discord.Member) -> Optional[bytes]:
+    """
+    The raw role ids of the member, `member._roles` is a sorted array so this is a single memory copy.
+    A cached entry is only used while its key matches the member's.
+    """
+    roles = getattr(member, '_roles', None)
+    if roles is None:
+        return None
+    try:
+        return roles.tobytes()
+    except AttributeError:
+        return repr(sorted(roles)).encode()
+
+
+class MemberPermissions:
+    """
+    Snapshot of the permissions and roles of a member, returned by :meth:`PermissionCache.get`.
+
+    Attributes
+    ----------
+    value: :class:`int`
+        The guild permissions bitfield.
+    roles: :class:`FrozenSet[int]`
+        Ids of the roles of the member.
+    top_role: :class:`discord.Role`
+        The highest role of the member.
+    """
+    __slots__ = ('value', 'roles', 'top_role', 'expires', '_roles_key')
+
+    def __init__(self,
+                 value: int,
+                 roles: FrozenSet[int],
+                 top_role: discord.Role,
+                 expires: float,
+                 roles_key: Optional[bytes] = None):
+        self.value = value
+        self.roles = roles
+        self.top_role = top_role
+        self.expires = expires
+        self._roles_key = roles_key
+
+    @property
+    def administrator(self) -> bool:
+        return bool(self.value & _ADMINISTRATOR)
+
+    @property
+    def permissions(self) -> discord.Permissions:
+        """The bitfield as :class:`discord.Permissions`"""
+        return discord.Permissions(self.value)
+
+    def __repr__(self):
+        return f"MemberPermissions(value={self.value}, roles={len(self.roles)})"
+
+
+class PermissionCache:
+    """
+    Per member cache of guild permissions and role ids, plus a per guild index of role names.
+
+    Entries are keyed by `(guild_id, member_id)` and are dropped on **member_update** and **member_remove**.
+    Role updates and ownership transfers drop the entries of the whole guild.
+
+    There's a single cache per bot, retrieve it with :meth:`PermissionCache.of`.
+    Every check in :mod:`dpytools.checks` reads the permissions of ctx.author through it.
+
+    .. note::
+        Member updates are only received with the members intent.
+        Without it, role changes are still noticed because every hit compares the role ids the entry was computed
+        with against the ones of the member object, which discord.py builds from each message.
+
+    Parameters
+    ----------
+    bot: :class:`discord.ext.commands.Bot`
+        The bot whose events invalidate the cache.
+    maxsize: :class:`int`
+        Maximum amount of members kept, the oldest entries are dropped first.
+    ttl: :class:`Optional[float]` (seconds)
+        Maximum age of an entry, None to keep entries until an event invalidates them.
+    """
+    _caches = weakref.WeakKeyDictionary()
+
+    def __init__(self, bot: commands.Bot, maxsize: int = 10000, ttl: Optional[float] = 300):
+        self._bot = weakref.ref(bot)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._members: Dict[Tuple[int, int], MemberPermissions] = {}
+        self._guild_members: Dict[int, Set[int]] = {}
+        self._role_names: Dict[int, Dict[str, int]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._listeners = (
+            (self._on_member_update, 'on_member_update'),
+            (self._on_member_remove, 'on_member_remove'),
+            (self._on_guild_role_create, 'on_guild_role_create'),
+            (self._on_guild_role_update, 'on_guild_role_update'),
+            (self._on_guild_role_delete, 'on_guild_role_delete'),
+            (self._on_guild_update, 'on_guild_update'),
+            (self._on_guild_remove, 'on_guild_remove'),
+        )
+        for listener, name in self._listeners:
+            bot.add_listener(listener, name)
+
+    @classmethod
+    def of(cls, bot: commands.Bot) -> 'PermissionCache':
+        """
+        Returns the cache of the bot, creating it if it doesn't exist yet.
+
+        Parameters
+        ----------
+        bot: :class:`discord.ext.commands.Bot`
+            The bot whose events invalidate the cache.
+        """
+        cache = cls._caches.get(bot)
+        if cache is None:
+            cache = cls._caches[bot] = cls(bot)
+        return cache
+
+    def __len__(self):
+        """The amount of cached members"""
+        return len(self._members)
+
+    def get(self, member: discord.Member) -> MemberPermissions:
+        """
+        Returns the guild permissions and roles of a member, computing them on the first call.
+
+        Parameters
+        ----------
+        member: :class:`discord.Member`
+            The member, usually ctx.author inside a guild.
+        """
+        key = (member.guild.id, member.id)
+        entry = self._members.get(key)
+        roles_key = _roles_key(member)
+        if (entry is not None
+                and entry._roles_key == roles_key
+                and (self.ttl is None or entry.expires > time.monotonic())):
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        expires = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        entry = MemberPermissions(member.guild_permissions.value,
+                                  frozenset(role.id for role in member.roles),
+                                  member.top_role,
+                                  expires,
+                                  roles_key)
+        self._members.pop(key, None)
+        if len(self._members) >= self.maxsize:
+            self._drop(next(iter(self._members)))
+        self._members[key] = entry
+        self._guild_members.setdefault(key[0], set()).add(key[1])
+        return entry
+
+    def role_id(self, guild: discord.Guild, name: str) -> Optional[int]:
+        """
+        Returns the id of the role of the guild called **name**, same as `utils.get(guild.roles, name=name)`.
+
+        Parameters
+        ----------
+        guild: :class:`discord.Guild`
+            The guild of the role.
+        name: :class:`str`
+            The name of the role, case sensitive.
+        """
+        names = self._role_names.get(guild.id)
+        if names is None:
+            names = {}
+            for role in guild.roles:
+                names.setdefault(role.name, role.id)
+            self._role_names[guild.id] = names
+        return names.get(name)
+
+    def _drop(self, key: Tuple[int, int]):
+        self._members.pop(key, None)
+        if (members := self._guild_members.get(key[0])) is not None:
+            members.discard(key[1])
+            if not members:
+                del self._guild_members[key[0]]
+
+    def invalidate_guild(self, guild_id: int):
+        """Drops every entry of the guild"""
+        for member_id in self._guild_members.pop(guild_id, ()):
+            self._members.pop((guild_id, member_id), None)
+        self._role_names.pop(guild_id, None)
+
+    def clear(self):
+        """Drops every entry"""
+        self._members.clear()
+        self._guild_members.clear()
+        self._role_names.clear()
+
+    def close(self):
+        """Unregisters the listeners and clears the cache"""
+        bot = self._bot()
+        if bot is not None:
+            for listener, name in self._listeners:
+                bot.remove_listener(listener, name)
+            self._caches.pop(bot, None)
+        self.clear()
+
+    async def _on_member_update(self, before: discord.Member, after: discord.Member):
+        self._drop((after.guild.id, after.id))
+
+    async def _on_member_remove(self, member: discord.Member):
+        self._drop((member.guild.id, member.id))
+
+    async def _on_guild_role_create(self, role: discord.Role):
+        self._role_names.pop(role.guild.id, None)
+
+    async def _on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        self.invalidate_guild(after.guild.id)
+
+    async def _on_guild_role_delete(self, role: discord.Role):
+        self.invalidate_guild(role.guild.id)
+
+    async def _on_guild_update(self, before: discord.Guild, after: discord.Guild):
+        if before.owner_id != after.owner_id:  # the owner has every permission regardless of roles
+            self.invalidate_guild(after.id)
+
+    async def _on_guild_remove(self, guild: discord.Guild):
+        self.invalidate_guild(guild.id)
+
+
+class MemberResolver:
+    """
+    Finds out whether a user is a member of a guild without relying on the member cache.
+
+    Lookups try `guild.get_member` first, then a bounded cache of previous results,
+    and only then ask discord with `guild.fetch_member` (or `guild.query_members` through the gateway).
+    Users that aren't members are cached too, for **negative_ttl** seconds.
+    Concurrent lookups of the same user share a single request.
+
+    There's a single resolver per bot, retrieve it with :meth:`MemberResolver.of`.
+    :func:`dpytools.checks.dm_from_this_guild` uses it, so it works with `member_cache_flags` disabled.
+
+    Parameters
+    ----------
+    bot: :class:`discord.ext.commands.Bot`
+        The bot whose member events update the cache.
+    maxsize: :class:`int`
+        Maximum amount of results kept, the oldest are dropped first.
+    ttl: :class:`float` (seconds)
+        How long a found member is kept.
+    negative_ttl: :class:`float` (seconds)
+        How long a user that isn't a member is remembered as such.
+    use_gateway: :class:`bool`
+        If True lookups use `guild.query_members` instead of the REST endpoint. Requires the members intent.
+    """
+    _resolvers = weakref.WeakKeyDictionary()
+
+    def __init__(self,
+                 bot: commands.Bot,
+                 maxsize: int = 10000,
+                 ttl: float = 300,
+                 negative_ttl: float = 60,
+                 use_gateway: bool = False):
+        self._bot = weakref.ref(bot)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.use_gateway = use_gateway
+        self._entries: Dict[Tuple[int, int], Tuple[float, Optional[discord.Member]]] = {}
+        self._inflight: Dict[Tuple[int, int], asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.requests = 0
+        self._listeners = (
+            (self._on_member_join, 'on_member_join'),
+            (self._on_member_update, 'on_member_update'),
+            (self._on_member_remove, 'on_member_remove'),
+        )
+        for listener, name in self._listeners:
+            bot.add_listener(listener, name)
+
+    @classmethod
+    def of(cls, bot: commands.Bot) -> 'MemberResolver':
+        """
+        Returns the resolver of the bot, creating it if it doesn't exist yet.
+
+        Parameters
+        ----------
+        bot: :class:`discord.ext.commands.Bot`
+            The bot whose member events update the cache.
+        """
+        resolver = cls._resolvers.get(bot)
+        if resolver is None:
+            resolver = cls._resolvers[bot] = cls(bot)
+        return resolver
+
+    def __len__(self):
+        """The amount of cached results"""
+        return len(self._entries)
+
+    async def resolve(self, guild: discord.Guild, user_id: int) -> Optional[discord.Member]:
+        """
+        Returns the member of the guild with id **user_id**, or None if the user isn't a member.
+
+        Parameters
+        ----------
+        guild: :class:`discord.Guild`
+            The guild to look in.
+        user_id: :class:`int`
+            The id of the user.
+
+        Raises
+        ------
+        :class:`discord.HTTPException`
+            If the request fails for a reason other than the user not being a member, the failure isn't cached.
+        """
+        member = guild.get_member(user_id)
+        if member is not None:
+            self.hits += 1
+            return member
+
+        key = (guild.id, user_id)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(self._lookup(guild, user_id))
+            task.add_done_callback(lambda t: self._done(key, t))
+        return await asyncio.shield(task)
+
+    async def _lookup(self, guild: discord.Guild, user_id: int) -> Optional[discord.Member]:
+        self.requests += 1
+        if self.use_gateway:
+            members = await guild.query_members(user_ids=[user_id], limit=1, cache=False)
+            return members[0] if members else None
+        try:
+            return await guild.fetch_member(user_id)
+        except discord.NotFound:
+            return None
+
+    def _done(self, key: Tuple[int, int], task: asyncio.Future):
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._store(key, task.result())
+
+    def _store(self, key: Tuple[int, int], member: Optional[discord.Member]):
+        ttl = self.ttl if member is not None else self.negative_ttl
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + ttl, member)
+
+    def invalidate(self, guild_id: int, user_id: int):
+        """Forgets the result for a user in a guild"""
+        self._entries.pop((guild_id, user_id), None)
+
+    def clear(self):
+        """Drops every result"""
+        self._entries.clear()
+
+    def close(self):
+        """Unregisters the listeners and clears the cache"""
+        bot = self._bot()
+        if bot is not None:
+            for listener, name in self._listeners:
+                bot.remove_listener(listener, name)
+            self._resolvers.pop(bot, None)
+        self.clear()
+
+    async def _on_member_join(self, member: discord.Member):
+        self._store((member.guild.id, member.id), member)
+
+    async def _on_member_update(self, before: discord.Member, after: discord.Member):
+        if (after.guild.id, after.id) in self._entries:
+            self._store((after.guild.id, after.id), after)
+
+    async def _on_member_remove(self, member: discord.Member):
+        self._store((member.guild.id, member.id), None)
+
+
+class InvalidationClock:
+    """
+    Records when guilds, members and channels last changed, so cached results can be validated in O(1).
+
+    Every change bumps a global sequence number for the affected guild, member or channel.
+    A result computed at sequence `seq` is still valid while none of the things it depends on changed after it.
+    Changes older than **retention** seconds are forgotten, results cached longer than that must not be trusted.
+
+    There's a single clock per bot, retrieve it with :meth:`InvalidationClock.of`.
+    Used by :func:`dpytools.checks.cached_check`.
+
+    Parameters
+    ----------
+    bot: :class:`discord.ext.commands.Bot`
+        The bot whose events advance the clock.
+    retention: :class:`float` (seconds)
+        How long changes are remembered.
+    """
+    _clocks = weakref.WeakKeyDictionary()
+
+    def __init__(self, bot: commands.Bot, retention: float = 3600):
+        self._bot = weakref.ref(bot)
+        self.retention = retention
+        self._seq = itertools.count(1)
+        self._last = 0
+        self._guilds: Dict[int, int] = {}
+        self._members: Dict[Tuple[int, int], Tuple[int, float]] = {}
+        self._channels: Dict[int, int] = {}
+        self._listeners = (
+            (self._on_member_update, 'on_member_update'),
+            (self._on_member_remove, 'on_member_remove'),
+            (self._on_guild_update, 'on_guild_update'),
+            (self._on_guild_role_update, 'on_guild_role_update'),
+            (self._on_guild_role_delete, 'on_guild_role_delete'),
+            (self._on_guild_channel_update, 'on_guild_channel_update'),
+            (self._on_guild_channel_delete, 'on_guild_channel_delete'),
+            (self._on_guild_remove, 'on_guild_remove'),
+        )
+        for listener, name in self._listeners:
+            bot.add_listener(listener, name)
+
+    @classmethod
+    def of(cls, bot: commands.Bot) -> 'InvalidationClock':
+        """
+        Returns the clock of the bot, creating it if it doesn't exist yet.
+
+        Parameters
+        ----------
+        bot: :class:`discord.ext.commands.Bot`
+            The bot whose events advance the clock.
+        """
+        clock = cls._clocks.get(bot)
+        if clock is None:
+            clock = cls._clocks[bot] = cls(bot)
+        return clock
+
+    def now(self) -> int:
+        """The current sequence number, store it with a result to validate it later"""
+        return self._last
+
+    def _next(self) -> int:
+        self._last = next(self._seq)
+        return self._last
+
+    def valid(self, seq: int, guild_id: Optional[int], member_id: Optional[int], channel_id: Optional[int]) -> bool:
+        """Whether nothing a result computed at **seq** depends on changed since"""
+        if guild_id is not None:
+            if self._guilds.get(guild_id, 0) > seq:
+                return False
+            if member_id is not None and (bump := self._members.get((guild_id, member_id))) and bump[0] > seq:
+                return False
+        if channel_id is not None and self._channels.get(channel_id, 0) > seq:
+            return False
+        return True
+
+    def invalidate_guild(self, guild_id: int):
+        """Marks every result of the guild as outdated, for example after changing its configuration"""
+        self._guilds[guild_id] = self._next()
+
+    def invalidate_member(self, guild_id: int, member_id: int):
+        """Marks the results of a member of a guild as outdated"""
+        self._members[(guild_id, member_id)] = (self._next(), time.monotonic())
+        if self._last % 1024 == 0:
+            self._sweep()
+
+    def invalidate_channel(self, channel_id: int):
+        """Marks the results of a channel as outdated"""
+        self._channels[channel_id] = self._next()
+
+    def _sweep(self):
+        """Forgets member changes older than the retention, members are the only unbounded key"""
+        horizon = time.monotonic() - self.retention
+        self._members = {k: v for k, v in self._members.items() if v[1] > horizon}
+
+    def close(self):
+        """Unregisters the listeners"""
+        bot = self._bot()
+        if bot is not None:
+            for listener, name in self._listeners:
+                bot.remove_listener(listener, name)
+            self._clocks.pop(bot, None)
+
+    async def _on_member_update(self, before: discord.Member, after: discord.Member):
+        self.invalidate_member(after.guild.id, after.id)
+
+    async def _on_member_remove(self, member: discord.Member):
+        self.invalidate_member(member.guild.id, member.id)
+
+    async def _on_guild_update(self, before: discord.Guild, after: discord.Guild):
+        self.invalidate_guild(after.id)
+
+    async def _on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        self.invalidate_guild(after.guild.id)
+
+    async def _on_guild_role_delete(self, role: discord.Role):
+        self.invalidate_guild(role.guild.id)
+
+    async def _on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        self.invalidate_channel(after.id)
+
+    async def _on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self.invalidate_channel(channel.id)
+
+    async def _on_guild_remove(self, guild: discord.Guild):
+        self.invalidate_guild(guild.id)
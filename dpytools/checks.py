@@ -2,9 +2,14 @@
 """
 Checks ready to use with **discord.ext.commands**
 """
+import asyncio
+from array import array
+from collections import OrderedDict
 from copy import copy
 from datetime import datetime, time, timezone
-from typing import Union
+from inspect import isawaitable
+from time import monotonic, perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from discord import Member, Permissions
 from discord import utils
@@ -12,7 +17,10 @@ from discord.ext import commands
 from discord.ext.commands import PrivateMessageOnly, Context, MissingPermissions
 
 from dpytools import _silent_except
-from dpytools.errors import IncorrectGuild, NotMemberOfCorrectGuild, OutsidePermittedDatetime
+from dpytools.allowlists import AllowList
+from dpytools.schedules import Schedule, ScheduleStore
+from dpytools.caches import PermissionCache, MemberPermissions, MemberResolver, InvalidationClock
+from dpytools.errors import IncorrectGuild, NotMemberOfCorrectGuild, OutsidePermittedDatetime, RateLimited
 
 __all__ = (
     'admin_or_roles',
@@ -22,13 +30,30 @@ __all__ = (
     'this_or_higher_role',
     'between_times',
     'between_datetimes',
+    'within_schedule',
     'only_these_users',
     'in_these_channels',
     'is_guild_owner',
     'any_checks',
+    'CheckStats',
+    'get_check_stats',
+    'cached_check',
+    'CheckCache',
+    'rate_limit',
+    'RateLimiter',
+    'evaluate_commands',
 )
 
 
+def _author_permissions(ctx: Context) -> MemberPermissions:
+    """Permissions of ctx.author, read from the bot's PermissionCache once per context"""
+    permissions = getattr(ctx, '_dpytools_permissions', None)
+    if permissions is None:
+        permissions = PermissionCache.of(ctx.bot).get(ctx.author)
+        ctx._dpytools_permissions = permissions
+    return permissions
+
+
 def admin_or_roles(*roles: Union[int, str]) -> commands.check:
     """
     Returns True under these conditions:
@@ -47,33 +72,33 @@ def admin_or_roles(*roles: Union[int, str]) -> commands.check:
             If ran from DM
         :class:`discord.ext.commands.MissingPermissions`
             If user doesn't have correct roles or admin permissions
+        :class:`TypeError`
+            When the decorator is applied, if any role isn't an int or a str
     """
 
-    async def predicate(ctx):
+    if not all(type(r) in [int, str] for r in roles):
+        raise TypeError('Roles must be type int or str')
 
-        if not all(type(r) in [int, str] for r in roles):
-            raise TypeError('Roles must be type int or str')
+    role_ids = frozenset(r for r in roles if isinstance(r, int))
+    role_names = tuple(r for r in roles if isinstance(r, str))
 
+    async def predicate(ctx):
         if ctx.guild is None:
             raise commands.NoPrivateMessage()
 
-        if ctx.author.guild_permissions.administrator is True:
+        cache = PermissionCache.of(ctx.bot)
+        author = _author_permissions(ctx)
+        if author.administrator:
             return True
 
-        discord_roles = []
-        for role in roles:
-            if isinstance(role, str):
-                discord_roles.append(utils.get(ctx.guild.roles, name=role))
-            elif isinstance(role, int):
-                discord_roles.append(ctx.guild.get_role(role))
-            else:
-                raise TypeError(f'int or str was expected but received "{type(role)}"')
-
-        if not discord_roles:
+        if not roles:
             raise ValueError('No role in the server matched parameters')
 
-        if any([role for role in discord_roles if role and role in ctx.author.roles]):
+        if not role_ids.isdisjoint(author.roles):
             return True
+        for name in role_names:
+            if (role_id := cache.role_id(ctx.guild, name)) and role_id in author.roles:
+                return True
         else:
             raise commands.MissingPermissions("User doesn't have admin permissions or specified roles")
 
@@ -111,7 +136,8 @@ def dm_from_this_guild(guild_id: int, delete: bool = False) -> commands.check:
         - :param guild_id: is found within the **ctx.bot.guilds**.
         - **ctx.guild** is **None**
 
-    For this check to work the guilds and members intents must be enabled.
+    For this check to work the guilds intent must be enabled.
+    Membership is resolved with :class:`dpytools.caches.MemberResolver`, the member cache isn't required.
 
     Parameters
     ----------
@@ -141,7 +167,7 @@ def dm_from_this_guild(guild_id: int, delete: bool = False) -> commands.check:
         guild = ctx.bot.get_guild(guild_id)
         if not guild:
             raise ValueError("Guild not found in the bot's guild cache")
-        if ctx.author in guild.members:
+        if await MemberResolver.of(ctx.bot).resolve(guild, ctx.author.id) is not None:
             return True
         else:
             raise NotMemberOfCorrectGuild("This command is unavailable to you.")
@@ -176,18 +202,23 @@ def any_of_permissions(**permissions) -> commands.check:
             If ran outside a guild
         :class:`discord.ext.commands.MissingPermissions`
             If ctx.author does not have any of the passed permissions
+        :class:`TypeError`
+            When the decorator is applied, if any permission name is invalid
     """
 
+    if invalid := (set(permissions) - set(Permissions.VALID_FLAGS)):
+        raise TypeError('Invalid permission(s): %s' % (', '.join(invalid)))
+
+    # flags that must be set and flags that must be unset, a single AND each
+    granted = Permissions(**{k: True for k, v in permissions.items() if v}).value
+    denied = Permissions(**{k: True for k, v in permissions.items() if not v}).value
+
     async def predicate(ctx):
-        if invalid := (set(permissions) - set(Permissions.VALID_FLAGS)):
-            raise TypeError('Invalid permission(s): %s' % (', '.join(invalid)))
-        elif ctx.guild is None:
+        if ctx.guild is None:
             raise commands.NoPrivateMessage("Command was called from a direct message.")
 
-        author: Member = ctx.author
-        author_perms: Permissions = author.guild_permissions
-        matched = [k for k, v in permissions.items() if getattr(author_perms, k) == v]
-        if any(matched):
+        value = _author_permissions(ctx).value
+        if value & granted or ~value & denied:
             return True
         else:
             raise commands.MissingPermissions("'You are missing one or more permission(s) to run this command.")
@@ -211,20 +242,21 @@ def this_or_higher_role(role: Union[str, int]) -> commands.check:
             If called outside a guild
     """
 
+    if type(role) not in [int, str]:
+        raise TypeError('Roles must be type int or str')
+
     def predicate(ctx):
         if ctx.guild is None:
             raise commands.NoPrivateMessage('This command can only be used in a server.')
-        author: Member = ctx.author
 
-        if type(role) not in [int, str]:
-            raise TypeError('Roles must be type int or str')
-
-        drole = utils.get(ctx.guild.roles, name=role) if isinstance(role, str) else ctx.guild.get_role(role)
+        cache = PermissionCache.of(ctx.bot)
+        role_id = cache.role_id(ctx.guild, role) if isinstance(role, str) else role
+        drole = ctx.guild.get_role(role_id) if role_id else None
 
         if not drole:
             raise ValueError(f'No role found within guild {ctx.guild.name} with name or id "{role}"')
 
-        return author.top_role >= drole
+        return _author_permissions(ctx).top_role >= drole
 
     return commands.check(predicate)
 
@@ -268,21 +300,28 @@ def between_datetimes(from_dt: datetime,
     ----------
         from_dt: :class:`datetime`
         to_dt: :class:`datetime`
+
+    Raises
+    ------
+        :class:`TypeError`
+            When the decorator is applied, if only one of the parameters is aware
+        :class:`ValueError`
+            When the decorator is applied, if the parameters have different timezones
+        :class:`OutsidePermittedDatetime`
+            If the command is called outside the interval
     """
 
-    def predicate(ctx: Context):
-        tzs = (from_dt.tzinfo, to_dt.tzinfo)
-        if any(tzs) and not all(tzs):
-            raise TypeError("Either from_dt and to_dt must be both aware or both naive")
+    tzs = (from_dt.tzinfo, to_dt.tzinfo)
+    if any(tzs) and not all(tzs):
+        raise TypeError("Either from_dt and to_dt must be both aware or both naive")
+    if all(tzs) and tzs[0] != tzs[1]:
+        raise ValueError("When both params are aware their timezones must match.")
+    tzconvert = tzs[0]
 
+    def predicate(ctx: Context):
         dt: datetime = ctx.message.created_at
-
-        if all(tzs):
-            if tzs[0] != tzs[1]:
-                raise ValueError("When both params are aware their timezones must match.")
-            else:
-                tzconvert = tzs[0]
-                dt = dt.replace(tzinfo=timezone.utc).astimezone(tzconvert)
+        if tzconvert is not None:
+            dt = dt.replace(tzinfo=timezone.utc).astimezone(tzconvert)
         check = from_dt <= dt <= to_dt
         if check:
             return True
@@ -293,7 +332,63 @@ def between_datetimes(from_dt: datetime,
     return commands.check(predicate)
 
 
-def only_these_users(*users: int) -> commands.check:
+def within_schedule(schedule: Union[Schedule, ScheduleStore]) -> commands.check:
+    """
+    Returns True under the following conditions:
+        - **ctx.message.created_at** falls inside an open window of the schedule
+
+    Parameters
+    ----------
+        schedule: :class:`Union[dpytools.schedules.Schedule, dpytools.schedules.ScheduleStore]`
+            A single schedule, or a store with a schedule per guild that can be updated at any time.
+            Guilds without a schedule in the store (and DMs without a default) are always open.
+
+    Example
+    -------
+    ::
+
+        from datetime import time
+        from dpytools.schedules import Schedule, ScheduleStore
+
+        opening_hours = ScheduleStore(default=Schedule([('mon-fri', time(9), time(17))]))
+
+        @within_schedule(opening_hours)
+        @bot.command()
+        async def support(ctx):
+            ...
+
+        # later, without touching the command
+        opening_hours.set(ctx.guild.id, Schedule([('mon-sat', time(8), time(20))], tz='America/Mexico_City'))
+
+    Raises
+    ------
+        :class:`OutsidePermittedDatetime`
+            If the schedule is closed
+    """
+    if isinstance(schedule, Schedule):
+        schedule = ScheduleStore(default=schedule)
+    elif not isinstance(schedule, ScheduleStore):
+        raise TypeError('schedule must be a Schedule or a ScheduleStore')
+
+    def predicate(ctx: Context):
+        current = schedule.get(ctx.guild.id if ctx.guild is not None else None)
+        if current is None or current.is_open(ctx.message.created_at):
+            return True
+        raise OutsidePermittedDatetime("This command is not available at this time.")
+
+    return commands.check(predicate)
+
+
+def _allowed_ids(ids: tuple) -> Union[frozenset, AllowList]:
+    """A single :class:`dpytools.allowlists.AllowList` is used as is so its updates are seen by the check"""
+    if len(ids) == 1 and isinstance(ids[0], AllowList):
+        return ids[0]
+    if any(isinstance(i, AllowList) for i in ids):
+        raise TypeError('An AllowList must be the only argument')
+    return frozenset(ids)
+
+
+def only_these_users(*users: Union[int, AllowList]) -> commands.check:
     """
     Returns True under the following conditions:
         - ctx.author is authorized by this check
@@ -303,17 +398,37 @@ def only_these_users(*users: int) -> commands.check:
 
     Parameters
     ----------
-        users: :class:`int`
-            the ids of the user's that are authorized to use this command
+        users: :class:`Union[int, dpytools.allowlists.AllowList]`
+            the ids of the user's that are authorized to use this command,
+            or an allowlist that can be updated while the bot runs
+
+    Raises
+    ------
+        TypeError
+            If an allowlist is passed along other arguments
+
+    Example
+    -------
+    ::
+
+        from dpytools.allowlists import FileAllowList
+        testers = FileAllowList('testers.txt')  # call testers.start() once the loop is running
+
+        @only_these_users(testers)
+        @bot.command()
+        async def beta(ctx):
+            ...
     """
 
+    users = _allowed_ids(users)
+
     def predicate(ctx):
         return ctx.author.id in users
 
     return commands.check(predicate)
 
 
-def in_these_channels(*channels: int) -> commands.check:
+def in_these_channels(*channels: Union[int, AllowList]) -> commands.check:
     """
     Returns True under the following conditions:
         - **ctx.channel.id** is found within :param channels:
@@ -323,10 +438,18 @@ def in_these_channels(*channels: int) -> commands.check:
 
     Parameters
     ----------
-        channels: :class:`int`
-            One or more channel ids where this command can run
+        channels: :class:`Union[int, dpytools.allowlists.AllowList]`
+            One or more channel ids where this command can run,
+            or an allowlist that can be updated while the bot runs
+
+    Raises
+    ------
+        TypeError
+            If an allowlist is passed along other arguments
     """
 
+    channels = _allowed_ids(channels)
+
     def predicate(ctx):
         return ctx.channel.id in channels
 
@@ -349,21 +472,34 @@ def is_guild_owner() -> commands.check:
     return commands.check(predicate)
 
 
-def any_checks(f: commands.Command):
+def any_checks(f: Optional[commands.Command] = None, *, sync_first: bool = True, adaptive: bool = False):
     """Decorator to handle optional checks
 
     This Decorator will make any @checks placed below itself to be called with a logical OR.
     This means that if one or more return True, the command will be able to run
 
+    The checks run concurrently and the first one that passes cancels the rest,
+    so a slow check doesn't delay the command when a fast one already passed.
+
     .. note::
 
-        When using this decorator remember that you don't need to call it::
+        The decorator can be used with or without calling it::
 
-            # correct
             @any_checks
 
-            # incorrect
-            @any_checks()
+            @any_checks(sync_first=False)
+
+    Parameters
+    ----------
+    sync_first: :class:`bool` (default: **True**)
+        If True the checks that aren't coroutine functions run first, in order,
+        and the coroutine checks only start if all of them failed.
+        If False every check starts at once.
+    adaptive: :class:`bool` (default: **False**)
+        If True the checks run one at a time ordered by their observed latency divided by their pass rate,
+        so the cheapest check that usually decides the result runs first.
+        Latency and outcome of the last calls of each check are recorded in a :class:`CheckStats`,
+        see :func:`get_check_stats`.
 
     Example
     -------
@@ -393,26 +529,562 @@ def any_checks(f: commands.Command):
             If all checks below itself fail.
 
     """
+    if f is None:
+        return lambda func: any_checks(func, sync_first=sync_first, adaptive=adaptive)
 
     if not isinstance(f, commands.Command):
         raise TypeError("This decorator must be placed above the @command decorator.")
 
     checks = copy(f.checks)
+    if adaptive:
+        stats = CheckStats(checks)
+
+        async def adaptive_any_checks(ctx):
+            if len(checks) == 0:
+                return True
+            for index in stats.order():
+                start = perf_counter()
+                passed = bool(await _silent_except(checks[index], ctx))
+                stats.record(index, perf_counter() - start, passed)
+                if passed:
+                    return True
+            raise commands.CheckFailure(f'All optional checks for command "{f.qualified_name}" failed')
+
+        adaptive_any_checks.stats = stats  # kept on the predicate so copies of the command made by cogs share it
+        f.checks = [adaptive_any_checks]
+        return f
+
+    if sync_first:
+        sync_checks = tuple(c for c in checks if not asyncio.iscoroutinefunction(c))
+        async_checks = tuple(c for c in checks if asyncio.iscoroutinefunction(c))
+    else:
+        sync_checks, async_checks = (), tuple(checks)
 
     async def async_any_checks(ctx):
         if len(checks) == 0:
             return True
-        else:
-            result = any([await _silent_except(c, ctx) for c in checks])
-            if result:
-                return True
-            else:
-                raise commands.CheckFailure(f'All optional checks for command "{f.qualified_name}" failed')
+        for check in sync_checks:
+            try:
+                result = check(ctx)
+                if isawaitable(result):  # a plain function may still return a coroutine
+                    result = await result
+                if result:
+                    return True
+            except Exception:
+                pass
+        if await _first_passing(async_checks, ctx):
+            return True
+        raise commands.CheckFailure(f'All optional checks for command "{f.qualified_name}" failed')
 
     f.checks = [async_any_checks]
     return f
 
 
+def get_check_stats(command: commands.Command) -> Optional['CheckStats']:
+    """
+    Returns the :class:`CheckStats` of a command decorated with `@any_checks(adaptive=True)`, or None.
+    Works with the copies of the command that cogs make when they are instantiated.
+
+    Parameters
+    ----------
+    command: :class:`discord.ext.commands.Command`
+        The command
+    """
+    for check in command.checks:
+        if isinstance(stats := getattr(check, 'stats', None), CheckStats):
+            return stats
+    return None
+
+
+class _Ring:
+    """This class is not intended to be instantiated or subclassed"""
+    __slots__ = ('latencies', 'outcomes', 'index', 'count', 'latency_sum', 'passed_sum', 'calls')
+
+    def __init__(self, size: int):
+        self.latencies = array('d', bytes(8 * size))
+        self.outcomes = bytearray(size)
+        self.index = 0
+        self.count = 0
+        self.latency_sum = 0.0
+        self.passed_sum = 0
+        self.calls = 0
+
+    def push(self, latency: float, passed: bool):
+        i = self.index
+        if self.count == len(self.outcomes):
+            self.latency_sum -= self.latencies[i]
+            self.passed_sum -= self.outcomes[i]
+        else:
+            self.count += 1
+        self.latencies[i] = latency
+        self.outcomes[i] = passed
+        self.latency_sum += latency
+        self.passed_sum += passed
+        self.index = (i + 1) % len(self.outcomes)
+        self.calls += 1
+
+
+class CheckStats:
+    """
+    Latency and pass rate of the checks of a command decorated with `@any_checks(adaptive=True)`,
+    over a window of their last calls. Get it with :func:`get_check_stats`.
+
+    Parameters
+    ----------
+    checks: :class:`Sequence[Callable]`
+        The predicates of the command.
+    window: :class:`int`
+        Amount of calls remembered per check.
+    reorder_every: :class:`int`
+        Amount of recorded calls between recomputing the evaluation order.
+
+    Example
+    -------
+    ::
+
+        for row in get_check_stats(bot.get_command('test')).snapshot():
+            print(row['check'], row['pass_rate'], row['mean_latency'])
+    """
+
+    def __init__(self, checks: Sequence[Callable], window: int = 64, reorder_every: int = 16):
+        self.names = tuple(getattr(c, '__qualname__', repr(c)) for c in checks)
+        self.rings = tuple(_Ring(window) for _ in checks)
+        self.reorder_every = reorder_every
+        self._order = tuple(range(len(checks)))
+        self._since_reorder = 0
+
+    def record(self, index: int, latency: float, passed: bool):
+        """Adds a call to the window of the check at **index**"""
+        self.rings[index].push(latency, passed)
+        self._since_reorder += 1
+        if self._since_reorder >= self.reorder_every:
+            self._since_reorder = 0
+            self._order = tuple(sorted(range(len(self.rings)), key=self.expected_cost))
+
+    def expected_cost(self, index: int) -> float:
+        """Mean latency divided by pass rate. Checks without samples go first so they get measured"""
+        ring = self.rings[index]
+        if not ring.count:
+            return 0.0
+        if not ring.passed_sum:
+            return float('inf')
+        return ring.latency_sum / ring.passed_sum
+
+    def order(self) -> Tuple[int, ...]:
+        """Indexes of the checks in evaluation order"""
+        return self._order
+
+    def snapshot(self) -> List[dict]:
+        """
+        Returns one dictionary per check in evaluation order, with keys
+        **check**, **calls**, **samples**, **pass_rate** and **mean_latency** (seconds)
+        """
+        rows = []
+        for index in self._order:
+            ring = self.rings[index]
+            rows.append({
+                'check': self.names[index],
+                'calls': ring.calls,
+                'samples': ring.count,
+                'pass_rate': ring.passed_sum / ring.count if ring.count else None,
+                'mean_latency': ring.latency_sum / ring.count if ring.count else None,
+            })
+        return rows
+
+
+async def _first_passing(checks: Sequence[Callable], ctx: Context) -> bool:
+    """Runs the checks concurrently, returns True as soon as one passes cancelling the others"""
+    if not checks:
+        return False
+    if len(checks) == 1:
+        return bool(await _silent_except(checks[0], ctx))
+
+    pending = {asyncio.ensure_future(_silent_except(check, ctx)) for check in checks}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if any(task.result() for task in done):
+                return True
+        return False
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+class CheckCache:
+    """
+    Result cache of a check wrapped with :func:`cached_check`, available as **decorator.cache**.
+
+    Attributes
+    ----------
+    hits: :class:`int`
+        Calls answered from the cache.
+    misses: :class:`int`
+        Calls that evaluated the check.
+    """
+
+    def __init__(self, predicate: Callable, ttl: float, maxsize: int, per_channel: bool):
+        self.predicate = predicate
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.per_channel = per_channel
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Drops every cached result"""
+        self._entries.clear()
+
+    async def __call__(self, ctx: Context):
+        guild_id = ctx.guild.id if ctx.guild is not None else None
+        channel_id = ctx.channel.id if self.per_channel else None
+        key = (guild_id, ctx.author.id, channel_id)
+        clock = InvalidationClock.of(ctx.bot)
+        now = monotonic()
+
+        entry = self._entries.get(key)
+        if (entry is not None
+                and now - entry[1] < min(self.ttl, clock.retention)
+                and clock.valid(entry[0], guild_id, ctx.author.id, channel_id)):
+            self.hits += 1
+            self._entries.move_to_end(key)
+            if entry[3] is not None:
+                raise entry[3].with_traceback(None)
+            return entry[2]
+
+        self.misses += 1
+        seq = clock.now()
+        try:
+            result = self.predicate(ctx)
+            if isawaitable(result):
+                result = await result
+        except commands.CommandError as error:
+            self._store(key, (seq, now, False, error))
+            raise
+        self._store(key, (seq, now, result, None))
+        return result
+
+    def _store(self, key: tuple, entry: tuple):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def cached_check(check: Callable,
+                 *,
+                 ttl: float = 60.0,
+                 maxsize: int = 4096,
+                 per_channel: bool = True) -> commands.check:
+    """
+    Caches the result of a check per guild, author and channel.
+
+    Cached results are dropped after **ttl** seconds or as soon as the guild, the member or the channel
+    change, as reported by :class:`dpytools.caches.InvalidationClock`.
+    Failures are cached too and raise the same exception again.
+    Use it for checks whose result only changes with roles or configuration, like role checks or database lookups.
+
+    Parameters
+    ----------
+    check:
+        A check decorator, like `admin_or_roles('Mod')` or `commands.has_role('Admin')`,
+        or a predicate function or coroutine function that takes the context.
+    ttl: :class:`float` (seconds)
+        Maximum age of a result.
+    maxsize: :class:`int`
+        Maximum amount of results kept, the least recently used are dropped first.
+    per_channel: :class:`bool`
+        Whether the channel is part of the key. Disable it for checks that don't depend on the channel.
+
+    Example
+    -------
+    ::
+
+        from dpytools.checks import cached_check, admin_or_roles
+
+        @cached_check(admin_or_roles('Mod', 'Helper'), per_channel=False)
+        @bot.command()
+        async def test(ctx):
+            await ctx.send('The command works')
+
+        # after changing the configuration the check depends on
+        InvalidationClock.of(bot).invalidate_guild(ctx.guild.id)
+
+    .. note::
+
+        Only results and :class:`discord.ext.commands.CommandError` failures are cached,
+        any other exception propagates without being cached.
+    """
+    cache = CheckCache(getattr(check, 'predicate', check), ttl, maxsize, per_channel)
+
+    async def predicate(ctx):
+        return await cache(ctx)
+
+    decorator = commands.check(predicate)
+    decorator.cache = cache
+    return decorator
+
+
+_BUCKET_KEYS = {
+    'user': lambda ctx: ctx.author.id,
+    'guild': lambda ctx: ctx.guild.id if ctx.guild is not None else ctx.author.id,
+    'channel': lambda ctx: ctx.channel.id,
+    'member': lambda ctx: (ctx.guild.id << 64 | ctx.author.id) if ctx.guild is not None else ctx.author.id,
+}
+
+
+class RateLimiter:
+    """
+    Rate limit implemented with the generic cell rate algorithm (GCRA).
+
+    Each key stores a single float, the time at which its bucket will be empty again.
+    Keys live in two generations of dictionaries that rotate every time a full bucket would refill,
+    so keys that stopped being used are dropped without scanning and memory is bounded by the keys
+    seen in the last two periods.
+
+    A single limiter can be shared by several commands through :meth:`check`,
+    :func:`rate_limit` creates one per command.
+
+    Parameters
+    ----------
+    rate: :class:`int`
+        Amount of uses allowed per **per** seconds.
+    per: :class:`float` (seconds)
+        Period of the rate.
+    bucket: :class:`str`
+        What the limit applies to, one of **'user'**, **'member'**, **'guild'** or **'channel'**.
+        Outside guilds 'member' and 'guild' fall back to the user.
+    burst: :class:`Optional[int]`
+        Amount of uses allowed at once, defaults to **rate**.
+    maxsize: :class:`int`
+        If more keys than this are seen within a period, the oldest generation is dropped early,
+        forgiving the limits of those keys instead of growing.
+
+    Example
+    -------
+    ::
+
+        from dpytools.checks import RateLimiter
+
+        search_limit = RateLimiter(5, 60, bucket='guild')
+
+        @search_limit.check()
+        @bot.command()
+        async def search(ctx, *, query):
+            ...
+
+        @search_limit.check()
+        @bot.command()
+        async def lookup(ctx, *, query):
+            ...
+    """
+    __slots__ = ('rate', 'per', 'bucket', 'burst', 'maxsize', '_key', '_interval', '_tolerance',
+                 '_current', '_previous', '_rotate_at')
+
+    def __init__(self, rate: int, per: float, bucket: str = 'user', burst: Optional[int] = None, maxsize: int = 100000):
+        if bucket not in _BUCKET_KEYS:
+            raise ValueError(f'bucket must be one of {", ".join(_BUCKET_KEYS)}')
+        if rate <= 0 or per <= 0:
+            raise ValueError('rate and per must be positive')
+        self.rate = rate
+        self.per = per
+        self.bucket = bucket
+        self.burst = burst or rate
+        self.maxsize = maxsize
+        self._key = _BUCKET_KEYS[bucket]
+        self._interval = per / rate
+        self._tolerance = self._interval * (self.burst - 1)
+        self._current: Dict[Any, float] = {}
+        self._previous: Dict[Any, float] = {}
+        self._rotate_at = 0.0
+
+    def __len__(self):
+        """The amount of tracked keys"""
+        return len(self._current) + len(self._previous)
+
+    def _rotate(self, now: float):
+        # a key untouched for a whole period has a tat in the past, it's the same as a new key
+        self._previous, self._current = self._current, {}
+        self._rotate_at = now + self._tolerance + self._interval
+
+    def hit(self, key: Any, now: Optional[float] = None) -> float:
+        """
+        Records a use of **key**
+
+        Returns
+        -------
+        :class:`float`
+            0.0 if the use is allowed, otherwise the seconds until it would be
+        """
+        if now is None:
+            now = monotonic()
+        if now >= self._rotate_at or len(self._current) >= self.maxsize:
+            if now >= self._rotate_at + self._tolerance + self._interval:
+                self._current = {}  # nothing was used for a whole period, every bucket refilled
+            self._rotate(now)
+
+        tat = self._current.get(key)
+        if tat is None:
+            tat = self._previous.pop(key, now)
+        if tat < now:
+            tat = now
+        if tat - now > self._tolerance:
+            self._current[key] = tat
+            return tat - self._tolerance - now
+        self._current[key] = tat + self._interval
+        return 0.0
+
+    def peek(self, key: Any, now: Optional[float] = None) -> float:
+        """Same as :meth:`hit` without recording the use"""
+        if now is None:
+            now = monotonic()
+        tat = self._current.get(key)
+        if tat is None:
+            tat = self._previous.get(key, now) if now < self._rotate_at else now
+        return max(0.0, tat - self._tolerance - now)
+
+    def reset(self, key: Any):
+        """Forgets the uses of **key**"""
+        self._current.pop(key, None)
+        self._previous.pop(key, None)
+
+    def check(self) -> commands.check:
+        """
+        Returns a check that uses this limiter
+
+        Raises
+        ------
+        :class:`dpytools.errors.RateLimited`
+            If the bucket of the context is empty, **retry_after** has the seconds to wait
+        """
+        def predicate(ctx):
+            if retry_after := self.hit(self._key(ctx)):
+                raise RateLimited(retry_after)
+            return True
+
+        def dry_run(ctx):
+            return not self.peek(self._key(ctx))
+
+        predicate.dry_run = dry_run  # used by evaluate_commands so listing commands doesn't consume uses
+        return commands.check(predicate)
+
+
+def rate_limit(rate: int, per: float, bucket: str = 'user', burst: Optional[int] = None) -> commands.check:
+    """
+    Returns True under the following conditions:
+        - The bucket of the context has been used less than **rate** times in the last **per** seconds
+
+    Memory stays bounded with any amount of users, see :class:`RateLimiter`.
+    To share the limit between commands create a :class:`RateLimiter` and use its :meth:`RateLimiter.check`.
+
+    Parameters
+    ----------
+        rate: :class:`int`
+            Amount of uses allowed per **per** seconds.
+        per: :class:`float` (seconds)
+            Period of the rate.
+        bucket: :class:`str`
+            One of **'user'** (default), **'member'**, **'guild'** or **'channel'**.
+        burst: :class:`Optional[int]`
+            Amount of uses allowed at once, defaults to **rate**.
+
+    Example
+    -------
+    ::
+
+        @rate_limit(3, 10, bucket='member')
+        @bot.command()
+        async def test(ctx):
+            await ctx.send('The command works')
+
+    Raises
+    ------
+        :class:`dpytools.errors.RateLimited`
+            If the limit was reached, **retry_after** has the seconds to wait
+    """
+    return RateLimiter(rate, per, bucket, burst).check()
+
+
+async def evaluate_commands(ctx: Context, command_list: Iterable[commands.Command]) -> Dict[commands.Command, bool]:
+    """
+    Returns which commands can run in a context, for help menus and autocomplete listings.
+
+    Like calling `command.can_run(ctx)` on each command with errors counted as failures, but:
+
+        - A check object attached to several commands runs once and its result is reused for all of them
+        - The permissions of ctx.author are looked up once for every check in this module
+        - Rate limits are peeked at without consuming uses
+
+    The bot's global checks and the cog checks run for every command with **ctx.command** set to it.
+
+    .. warning::
+
+        Because of the reuse, a check shared by several commands that reads **ctx.command**
+        is only evaluated for the first of them. None of the checks in this module read it.
+
+    Parameters
+    ----------
+        ctx: :class:`discord.ext.commands.Context`
+            The context to evaluate the commands in, usually the one of the help command.
+        command_list: :class:`Iterable[discord.ext.commands.Command]`
+            The commands to evaluate, for example `bot.walk_commands()`.
+
+    Returns
+    -------
+        :class:`Dict[discord.ext.commands.Command, bool]`
+            Whether each command can run
+
+    Example
+    -------
+    ::
+
+        from dpytools.checks import evaluate_commands
+
+        @bot.command()
+        async def commands_list(ctx):
+            allowed = await evaluate_commands(ctx, bot.walk_commands())
+            await ctx.send(', '.join(c.qualified_name for c, ok in allowed.items() if ok))
+    """
+    async def run(predicate) -> bool:
+        predicate = getattr(predicate, 'dry_run', predicate)
+        if predicate not in memo:
+            try:
+                memo[predicate] = bool(await utils.maybe_coroutine(predicate, ctx))
+            except Exception:
+                memo[predicate] = False
+        return memo[predicate]
+
+    memo: Dict[Callable, bool] = {}
+    original = ctx.command
+    results = {}
+    try:
+        for command in command_list:
+            ctx.command = command
+            if not command.enabled:
+                results[command] = False
+                continue
+            try:
+                passed = await ctx.bot.can_run(ctx)
+                if passed and command.cog is not None:
+                    local_check = commands.Cog._get_overridden_method(command.cog.cog_check)
+                    if local_check is not None:
+                        passed = bool(await utils.maybe_coroutine(local_check, ctx))
+            except Exception:
+                passed = False
+            for predicate in command.checks:
+                if not passed:
+                    break
+                passed = await run(predicate)
+            results[command] = passed
+    finally:
+        ctx.command = original
+    return results
+
+
 def is_admin():
     """
     Shorthand for `@commands.has_guild_permissions(administrator=True)`
@@ -420,7 +1092,7 @@ def is_admin():
     async def predicate(ctx):
         if ctx.guild is None:
             raise commands.NoPrivateMessage('This command can only be used in a server.')
-        if not ctx.author.guild_permissions.administrator:
+        if not _author_permissions(ctx).administrator:
             raise MissingPermissions('administrator')
 
         return True
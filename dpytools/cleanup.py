@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Deletion of groups of messages, such as the ones left behind by a menu.
+
+`channel.delete_messages` only accepts up to 100 messages younger than 14 days and doesn't work in DMs.
+:func:`delete_messages` splits the messages into bulk deletes where possible and deletes the rest one by one
+with a bounded amount of concurrent requests, reporting what was deleted and what failed.
+"""
+
+import asyncio
+import time
+from typing import Dict, Iterable, List, Optional
+
+import discord
+from discord.utils import DISCORD_EPOCH
+
+from dpytools.scheduler import RESTScheduler
+
+__all__ = (
+    'CleanupReport',
+    'delete_messages',
+)
+
+BULK_LIMIT = 100
+BULK_MAX_AGE = 14 * 24 * 60 * 60
+_AGE_MARGIN = 60  # seconds, so messages don't age out between sorting and the request
+
+
+class CleanupReport:
+    """
+    Result of :func:`delete_messages`
+
+    Attributes
+    ----------
+    deleted: :class:`int`
+        Messages deleted, including the ones that were already gone.
+    failed: :class:`int`
+        Messages that couldn't be deleted, for example user messages in DMs or missing permissions.
+    bulk_requests: :class:`int`
+        Amount of bulk delete requests made.
+    single_requests: :class:`int`
+        Amount of individual delete requests made.
+    """
+    __slots__ = ('deleted', 'failed', 'bulk_requests', 'single_requests')
+
+    def __init__(self):
+        self.deleted = 0
+        self.failed = 0
+        self.bulk_requests = 0
+        self.single_requests = 0
+
+    @property
+    def total(self) -> int:
+        """Amount of messages handled"""
+        return self.deleted + self.failed
+
+    def __repr__(self):
+        return (f"CleanupReport(deleted={self.deleted}, failed={self.failed}, "
+                f"bulk_requests={self.bulk_requests}, single_requests={self.single_requests})")
+
+
+def _bulk_min_id() -> int:
+    """Smallest message id that can still be bulk deleted"""
+    oldest = time.time() - BULK_MAX_AGE + _AGE_MARGIN
+    return int(oldest * 1000 - DISCORD_EPOCH) << 22
+
+
+def _deletable(message: discord.Message) -> bool:
+    """In DMs the bot can only delete its own messages"""
+    if message.guild is not None:
+        return True
+    me = getattr(message.channel, 'me', None)
+    return me is None or message.author.id == me.id
+
+
+async def _delete_one(message: discord.Message,
+                      report: CleanupReport,
+                      semaphore: asyncio.Semaphore,
+                      scheduler: Optional[RESTScheduler]):
+    async with semaphore:
+        report.single_requests += 1
+        try:
+            if scheduler is not None:
+                await scheduler.delete(message)
+            else:
+                await message.delete()
+        except discord.NotFound:
+            report.deleted += 1
+        except discord.HTTPException:
+            report.failed += 1
+        else:
+            report.deleted += 1
+
+
+async def _delete_chunk(channel: discord.TextChannel,
+                        chunk: List[discord.Message],
+                        report: CleanupReport,
+                        semaphore: asyncio.Semaphore,
+                        scheduler: Optional[RESTScheduler]):
+    async with semaphore:
+        report.bulk_requests += 1
+        try:
+            if scheduler is not None:
+                await scheduler.delete_messages(channel, chunk)
+            else:
+                await channel.delete_messages(chunk)
+        except discord.Forbidden:
+            report.failed += len(chunk)
+            return
+        except discord.HTTPException:
+            pass  # a message of the chunk is gone or too old, fall back to deleting them one by one
+        else:
+            report.deleted += len(chunk)
+            return
+    await asyncio.gather(*(_delete_one(message, report, semaphore, scheduler) for message in chunk))
+
+
+async def delete_messages(messages: Iterable[Optional[discord.Message]],
+                          *,
+                          concurrency: int = 4,
+                          scheduler: Optional[RESTScheduler] = None) -> CleanupReport:
+    """
+    Deletes messages from any amount of channels using as few requests as possible.
+
+    Messages of guild channels younger than 14 days are deleted in bulk in chunks of 100.
+    Older messages and DM messages are deleted one by one.
+    User messages in DMs can't be deleted by bots and are counted as failed without making a request.
+
+    Parameters
+    ----------
+    messages: :class:`Iterable[Optional[discord.Message]]`
+        The messages to delete, None values are ignored.
+    concurrency: :class:`int`
+        Maximum amount of delete requests in flight at the same time.
+    scheduler: :class:`Optional[dpytools.scheduler.RESTScheduler]`
+        If passed the requests go through it.
+
+    Returns
+    -------
+    :class:`CleanupReport`
+        Counts of deleted and failed messages.
+
+    Example
+    -------
+    ::
+
+        from dpytools.cleanup import delete_messages
+        report = await delete_messages(messages)
+        print(f"Deleted {report.deleted} messages, {report.failed} failed")
+    """
+    report = CleanupReport()
+    semaphore = asyncio.Semaphore(concurrency)
+    min_id = _bulk_min_id()
+    bulk: Dict[int, List[discord.Message]] = {}
+    single: List[discord.Message] = []
+    seen = set()
+
+    for message in messages:
+        if message is None or message.id in seen:
+            continue
+        seen.add(message.id)
+        if not _deletable(message):
+            report.failed += 1
+        elif message.guild is not None and message.id >= min_id:
+            bulk.setdefault(message.channel.id, []).append(message)
+        else:
+            single.append(message)
+
+    jobs = []
+    for channel_messages in bulk.values():
+        channel = channel_messages[0].channel
+        for i in range(0, len(channel_messages), BULK_LIMIT):
+            chunk = channel_messages[i:i + BULK_LIMIT]
+            if len(chunk) == 1:
+                single.append(chunk[0])  # bulk delete requires at least two messages
+            else:
+                jobs.append(_delete_chunk(channel, chunk, report, semaphore, scheduler))
+    jobs.extend(_delete_one(message, report, semaphore, scheduler) for message in single)
+    await asyncio.gather(*jobs)
+    return report
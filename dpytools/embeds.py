@@ -3,20 +3,79 @@
 This module holds functions to work with embeds in different ways.
 """
 
-from itertools import islice
-from typing import List, Optional, Union, Dict
+import asyncio
+import mmap
+from array import array
+from collections import OrderedDict
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional, Tuple, Union, Dict
 
 import discord
 from discord import Embed
-from discord.ext.commands import Paginator
 
 __all__ = (
     'paginate_to_embeds',
+    'stream_embeds',
+    'FilePages',
     'dict_to_fields',
     'Embed',
+    'EmbedReport',
     'PaginatedEmbeds',
 )
 
+class _LinePages:
+    """
+    Packs lines into pages like :class:`discord.ext.commands.Paginator` but hands each page out as soon as it's full.
+    Lines longer than a page are split instead of raising.
+    This class is not intended to be instantiated or subclassed
+    """
+    __slots__ = ('prefix', 'suffix', 'limit', 'width', '_lines', '_count', '_start')
+
+    def __init__(self, prefix: Optional[str], suffix: Optional[str], max_size: int):
+        self.prefix = prefix
+        self.suffix = suffix
+        # same accounting as Paginator, a page is its prefix and lines each followed by a line break, plus the suffix
+        self.limit = max_size - len(suffix or '')
+        self.width = max_size - len(prefix or '') - len(suffix or '') - 2
+        self._start = len(prefix) + 1 if prefix is not None else 0
+        if self.width < 1:
+            raise ValueError('max_size is too small for the prefix and suffix')
+        self._lines: List[str] = [prefix] if prefix is not None else []
+        self._count = self._start
+
+    def add(self, line: str) -> Iterator[str]:
+        """Adds a line and yields the pages it completes"""
+        while len(line) > self.width:
+            yield from self.add(line[:self.width])
+            line = line[self.width:]
+        if self._count + len(line) + 1 > self.limit:
+            yield self.close()
+        self._count += len(line) + 1
+        self._lines.append(line)
+
+    def close(self) -> str:
+        """Returns the current page and starts a new one"""
+        if self.suffix is not None:
+            self._lines.append(self.suffix)
+        page = '\n'.join(self._lines)
+        self._lines = [self.prefix] if self.prefix is not None else []
+        self._count = self._start
+        return page
+
+    @property
+    def pending(self) -> bool:
+        """Whether the current page has any line"""
+        return len(self._lines) > (self.prefix is not None)
+
+
+def _text_embed(page: str, footer: str, title: Optional[str], color: Union[discord.Color, int, None]) -> Embed:
+    embed = Embed(description=page).set_footer(text=footer)
+    if title:
+        embed.title = title
+    if color:
+        embed.colour = color
+    return embed
+
+
 def paginate_to_embeds(description: str,
                        title: Optional[str] = None,
                        max_size: int = 2000,
@@ -48,21 +107,237 @@ def paginate_to_embeds(description: str,
     Returns
     -------
     The rendered list of embeds :class:`List[Embed]`
+
+    .. note::
+
+        For large texts, files or lines produced over time see :func:`stream_embeds`.
+    """
+    pages = []
+    paginator = _LinePages(prefix, suffix, max_size)
+    for line in description.split("\n"):
+        pages.extend(paginator.add(line))
+    if paginator.pending:
+        pages.append(paginator.close())
+    return [_text_embed(page, f"page: {i}/{len(pages)}", title, color) for i, page in enumerate(pages, start=1)]
+
+
+async def stream_embeds(lines: Union[Iterable[str], AsyncIterable[str]],
+                        title: Optional[str] = None,
+                        max_size: int = 2000,
+                        prefix: Optional[str] = "",
+                        suffix: Optional[str] = "",
+                        color: Union[discord.Color, int, None] = None,
+                        page_count: Optional[int] = None
+                        ) -> AsyncIterator[Embed]:
+    """
+    Streaming version of :func:`paginate_to_embeds`.
+    Reads lines from a file object, an iterator or an async iterator and yields each embed as soon as its page is full,
+    only one page is held in memory at a time.
+
+    Parameters
+    ----------
+    lines: :class:`Union[Iterable[str], AsyncIterable[str]]`
+        The lines of the text, trailing line breaks are removed.
+    title: :class:`str`
+        Shared by all embeds
+    max_size: :class:`int`
+        Maximum amount of characters per embed.
+    prefix: :class:`str`
+        Appended at the start of the description of each embed.
+    suffix: :class:`str`
+        Same as :prefix: but at the end of the text.
+    color: :class:`Union[discord.Color, int, None]`
+        color to use for the embed.
+    page_count: :class:`Optional[int]`
+        The total amount of pages if known, otherwise footers read `page: n/?`.
+
+    Yields
+    ------
+    :class:`Embed`
+        Each page in order.
+
+    Example
+    -------
+    ::
+
+        from dpytools.embeds import stream_embeds
+        from dpytools.menus import arrows
+
+        @bot.command()
+        async def logs(ctx):
+            with open('bot.log') as file:
+                await arrows(ctx, stream_embeds(file, prefix='```', suffix='```'))
+    """
+    total = '?' if page_count is None else page_count
+    paginator = _LinePages(prefix, suffix, max_size)
+    number = 0
+
+    def render(page):
+        nonlocal number
+        number += 1
+        return _text_embed(page, f"page: {number}/{total}", title, color)
+
+    if hasattr(lines, '__aiter__'):
+        async for line in lines:
+            for page in paginator.add(line.rstrip('\r\n')):
+                yield render(page)
+    else:
+        for line in lines:
+            for page in paginator.add(line.rstrip('\r\n')):
+                yield render(page)
+                await asyncio.sleep(0)  # reading a large file shouldn't starve the event loop
+    if paginator.pending:
+        yield render(paginator.close())
+
+
+class FilePages:
+    """
+    Random access pages of a text file, without loading the file.
+
+    The file is memory mapped and scanned once to find where each page starts,
+    the offsets are kept in an `array('Q')` of 8 bytes per page, see :meth:`load` to scan it in a thread.
+    Getting a page decodes only its bytes, so a single instance can back any amount of open menus.
+    Page sizes are measured in bytes, which is never less than the amount of characters.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the file.
+    title: :class:`str`
+        Shared by all embeds
+    max_size: :class:`int`
+        Maximum amount of characters per embed.
+    prefix: :class:`str`
+        Appended at the start of the description of each embed.
+    suffix: :class:`str`
+        Same as :prefix: but at the end of the text.
+    color: :class:`Union[discord.Color, int, None]`
+        color to use for the embed.
+    encoding: :class:`str`
+        The encoding of the file, undecodable bytes are replaced.
+
+    Example
+    -------
+    ::
+
+        from dpytools.embeds import FilePages
+        from dpytools.menus import arrows
+
+        export = await FilePages.load('export.txt', prefix='```', suffix='```')
+
+        @bot.command()
+        async def show_export(ctx):
+            await arrows(ctx, export)
     """
-    embeds = []
-    to_list = description.split("\n")
-    paginator = Paginator(prefix=prefix, suffix=suffix, max_size=max_size)
-    for line in to_list:
-        paginator.add_line(line)
-    for i, page in enumerate(paginator.pages):
-        embed = Embed(description=page).set_footer(text=f"page: {i + 1}/{len(paginator.pages)}")
-        d = {'title': title, 'colour': color}
-        for attr in d:
-            if value := d[attr]:
-                setattr(embed, attr, value)
-
-        embeds.append(embed)
-    return embeds
+
+    def __init__(self,
+                 path: str,
+                 title: Optional[str] = None,
+                 max_size: int = 2000,
+                 prefix: Optional[str] = "",
+                 suffix: Optional[str] = "",
+                 color: Union[discord.Color, int, None] = None,
+                 encoding: str = 'utf-8'):
+        self.path = path
+        self.title = title
+        self.prefix = prefix
+        self.suffix = suffix
+        self.color = color
+        self.encoding = encoding
+        self._file = open(path, 'rb')
+        self._map = b''
+        try:
+            try:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty files can't be mapped
+                pass
+            self.size = len(self._map)
+            self._pages = self._paginate(max_size)
+        except BaseException:
+            self.close()
+            raise
+
+    @classmethod
+    async def load(cls, path: str, **kwargs) -> 'FilePages':
+        """Same as the constructor, the file is scanned in a thread"""
+        return await asyncio.get_running_loop().run_in_executor(None, lambda: cls(path, **kwargs))
+
+    def _boundary(self, offset: int) -> int:
+        """Moves an offset back to the start of a utf-8 character"""
+        while offset and 0x80 <= self._map[offset] < 0xC0:
+            offset -= 1
+        return offset
+
+    def _paginate(self, max_size: int) -> array:
+        """
+        Offsets where each page starts, packed like :func:`paginate_to_embeds`.
+        A page in bytes is its lines plus their line breaks, so each boundary is the last line break that fits,
+        found with a single `rfind` per page instead of walking every line.
+        """
+        start = len(self.prefix) + 1 if self.prefix is not None else 0
+        room = max_size - len(self.suffix or '') - start  # bytes of lines and line breaks that fit in a page
+        width = max_size - len(self.prefix or '') - len(self.suffix or '') - 2  # longest line, as in Paginator
+        if width < 1:
+            raise ValueError('max_size is too small for the prefix and suffix')
+
+        pages = array('Q')
+        end = self.size - 1 if self._map[-1:] == b'\n' else self.size
+        offset = 0
+        while offset < end:
+            pages.append(offset)
+            first = self._map.find(b'\n', offset, offset + width + 1)
+            if first == -1 and end - offset > width:
+                cut = offset + width  # lines longer than a page are split
+                if self.encoding == 'utf-8' and self._boundary(cut) > offset:
+                    cut = self._boundary(cut)
+                offset = cut
+                continue
+            if end - offset < room:
+                break
+            offset = self._map.rfind(b'\n', offset, offset + room) + 1
+        return pages
+
+    def __len__(self):
+        return len(self._pages)
+
+    def page_text(self, index: int) -> str:
+        """The description of the page at index, without rendering an embed"""
+        if index < 0:
+            index += len(self._pages)
+        if not 0 <= index < len(self._pages):
+            raise IndexError('page index out of range')
+        start = self._pages[index]
+        end = self._pages[index + 1] if index + 1 < len(self._pages) else self.size
+        text = self._map[start:end].decode(self.encoding, errors='replace')
+        if text.endswith('\n'):
+            text = text[:-1]
+        parts = [text.replace('\r\n', '\n')]
+        if self.prefix is not None:
+            parts.insert(0, self.prefix)
+        if self.suffix is not None:
+            parts.append(self.suffix)
+        return '\n'.join(parts)
+
+    def __getitem__(self, index: int) -> Embed:
+        description = self.page_text(index)
+        if index < 0:
+            index += len(self._pages)
+        return _text_embed(description, f"page: {index + 1}/{len(self._pages)}", self.title, self.color)
+
+    def close(self):
+        """Unmaps and closes the file"""
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return f"FilePages(path={self.path!r}, pages={len(self)})"
 
 
 def dict_to_fields(embed: Embed,
@@ -86,6 +361,44 @@ def dict_to_fields(embed: Embed,
         embed.add_field(name=k, value=v, inline=inline)
 
 
+FIELD_NAME_LIMIT = 256
+FIELD_VALUE_LIMIT = 1024
+DESCRIPTION_LIMIT = 2048
+_TITLE = discord.Embed.title  # slot descriptors of discord.Embed, wrapped by Embed's properties
+_DESCRIPTION = discord.Embed.description
+
+
+def _length(text) -> int:
+    """Length of an embed text that may be unset"""
+    return 0 if text is None or text is discord.Embed.Empty else len(str(text))
+
+
+class EmbedReport:
+    """
+    Result of :meth:`Embed.validate`
+
+    Attributes
+    ----------
+    length: :class:`int`
+        Total amount of characters of the embed.
+    violations: :class:`Dict[str, Tuple[int, int]]`
+        The exceeded limits as `{limit: (value, maximum)}`.
+        Limits are **title**, **description**, **fields** (amount), **oversized_fields** (fields whose name or value
+        is too long), **footer**, **author** and **total**.
+    """
+    __slots__ = ('length', 'violations')
+
+    def __init__(self, length: int, violations: Dict[str, Tuple[int, int]]):
+        self.length = length
+        self.violations = violations
+
+    def __bool__(self):
+        return not self.violations
+
+    def __repr__(self):
+        return f"EmbedReport(length={self.length}, violations={self.violations})"
+
+
 class Embed(discord.Embed):
     """
     This is a subclass of :class:`discord.Embed` which accepts its default values plus image and thumbnail in the
@@ -118,9 +431,17 @@ class Embed(discord.Embed):
     footer:
         A dict containing (optional) "text" and "icon_url" fields.
         Calls the internal "set_footer" method, setting the footer text and icon_url if applicable.
+
+    .. note::
+
+        The size of the embed is tracked as it's modified, `len(embed)`, :meth:`validate` and **is_valid**
+        don't walk its fields.
     """
 
     def __init__(self, **kwargs):
+        self._text_length = 0
+        self._fields_length = 0
+        self._oversized_fields = 0
         super().__init__(**kwargs)
 
         if author := kwargs.get('author', None):
@@ -135,17 +456,148 @@ class Embed(discord.Embed):
         if thumbnail := kwargs.get('thumbnail', None):
             self.set_thumbnail(url=thumbnail)
 
+    # The running size counters are kept up to date by every method that changes the text of the embed.
+    # Embeds built without __init__ (from_dict, cloning) start from _recount.
+
+    def _count(self, attribute: str, delta: int):
+        setattr(self, attribute, getattr(self, attribute, 0) + delta)
+
+    def _count_field(self, field: dict, sign: int):
+        self._count('_fields_length', sign * (len(field['name']) + len(field['value'])))
+        if len(field['name']) > FIELD_NAME_LIMIT or len(field['value']) > FIELD_VALUE_LIMIT:
+            self._count('_oversized_fields', sign)
+
+    def _recount(self):
+        """Computes the size counters from scratch"""
+        self._text_length = _length(self.title) + _length(self.description)
+        self._text_length += _length(getattr(self, '_footer', {}).get('text'))
+        self._text_length += _length(getattr(self, '_author', {}).get('name'))
+        self._fields_length = self._oversized_fields = 0
+        for field in getattr(self, '_fields', ()):
+            self._count_field(field, 1)
+
+    def __setstate__(self, state):
+        """Used by copy, deepcopy and pickle, slots are restored without going through the counting setters"""
+        dict_state, slot_state = state if isinstance(state, tuple) else (state, None)
+        if dict_state:
+            self.__dict__.update(dict_state)
+        for name, value in (slot_state or {}).items():
+            getattr(discord.Embed, name).__set__(self, value)
+        self._recount()
+
+    @property
+    def title(self):
+        return _TITLE.__get__(self)
+
+    @title.setter
+    def title(self, value):
+        try:
+            self._count('_text_length', _length(value) - _length(_TITLE.__get__(self)))
+        except AttributeError:
+            self._count('_text_length', _length(value))
+        _TITLE.__set__(self, value)
+
     @property
-    def is_valid(self):
-        """Returns a bool for whether the length of the embed is valid"""
-        return all([
-            len(self.fields) <= 25,
-            all([len(field.name) <= 256 and len(field.value) <= 1024 for field in self.fields]),
-            len(self.title) <= 256,
-            len(self.description) <= 2048,
-            len(self.footer.text) <= 2048 if self.footer else True,
-            len(self) <= 6000
-        ])
+    def description(self):
+        return _DESCRIPTION.__get__(self)
+
+    @description.setter
+    def description(self, value):
+        try:
+            self._count('_text_length', _length(value) - _length(_DESCRIPTION.__get__(self)))
+        except AttributeError:
+            self._count('_text_length', _length(value))
+        _DESCRIPTION.__set__(self, value)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Embed:
+        self = super().from_dict(data)
+        self._recount()
+        return self
+
+    def set_footer(self, **kwargs) -> Embed:
+        self._count('_text_length', -_length(getattr(self, '_footer', {}).get('text')))
+        super().set_footer(**kwargs)
+        self._count('_text_length', _length(self._footer.get('text')))
+        return self
+
+    def set_author(self, **kwargs) -> Embed:
+        self._count('_text_length', -_length(getattr(self, '_author', {}).get('name')))
+        super().set_author(**kwargs)
+        self._count('_text_length', _length(self._author.get('name')))
+        return self
+
+    def remove_author(self) -> Embed:
+        self._count('_text_length', -_length(getattr(self, '_author', {}).get('name')))
+        return super().remove_author()
+
+    def add_field(self, **kwargs) -> Embed:
+        super().add_field(**kwargs)
+        self._count_field(self._fields[-1], 1)
+        return self
+
+    def insert_field_at(self, index: int, **kwargs) -> Embed:
+        super().insert_field_at(index, **kwargs)
+        inserted = min(index, len(self._fields) - 1) if index >= 0 else max(len(self._fields) + index - 1, 0)
+        self._count_field(self._fields[inserted], 1)
+        return self
+
+    def set_field_at(self, index: int, **kwargs) -> Embed:
+        try:
+            old = self._fields[index]
+        except (AttributeError, IndexError):
+            raise IndexError('field index out of range')
+        self._count_field(old, -1)  # the field is updated in place
+        super().set_field_at(index, **kwargs)
+        self._count_field(old, 1)
+        return self
+
+    def remove_field(self, index: int):
+        try:
+            field = self._fields.pop(index)
+        except (AttributeError, IndexError):
+            return
+        self._count_field(field, -1)
+
+    def clear_fields(self):
+        super().clear_fields()
+        self._fields_length = self._oversized_fields = 0
+
+    def __len__(self):
+        return self._text_length + self._fields_length
+
+    def validate(self) -> 'EmbedReport':
+        """
+        Checks the embed against Discord's limits using the running size counters, without walking its fields.
+
+        Returns
+        -------
+        :class:`EmbedReport`
+            Truthy if the embed can be sent, otherwise its **violations** name the exceeded limits.
+
+        Example
+        -------
+        ::
+
+            report = embed.validate()
+            if not report:
+                print(report.violations)  # {'total': (6230, 6000)}
+        """
+        checks = (
+            ('title', _length(self.title), 256),
+            ('description', _length(self.description), DESCRIPTION_LIMIT),
+            ('fields', len(getattr(self, '_fields', ())), 25),
+            ('oversized_fields', self._oversized_fields, 0),
+            ('footer', _length(getattr(self, '_footer', {}).get('text')), 2048),
+            ('author', _length(getattr(self, '_author', {}).get('name')), 256),
+            ('total', len(self), 6000),
+        )
+        return EmbedReport(len(self), {name: (value, limit) for name, value, limit in checks if value > limit})
+
+    @property
+    def is_valid(self) -> bool:
+        """Returns a bool for whether the length of the embed is valid, see :meth:`validate` for the details"""
+        return bool(self.validate())
 
     def add_fields(self, inline=True, **kwargs) -> Embed:
         """
@@ -179,9 +631,34 @@ class Embed(discord.Embed):
         return self
 
 
+def _truncate(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[:limit - 3] + '...'
+
+
+def _clone(embed: discord.Embed) -> Embed:
+    """
+    Copies an embed slot by slot into a :class:`Embed`, without fields.
+    Much cheaper than a `to_dict`/`from_dict` round trip, the nested dicts are copied so pages don't share them.
+    """
+    clone = Embed.__new__(Embed)
+    for slot in discord.Embed.__slots__:
+        try:
+            value = getattr(embed, slot)
+        except AttributeError:
+            continue
+        setattr(clone, slot, value.copy() if isinstance(value, dict) else value)
+    clone._fields = []
+    clone._recount()
+    return clone
+
+
 class PaginatedEmbeds:
     """A class that takes dictionary containing name and value as key-value pair and paginates them according to fields.
 
+    Pages are rendered when they are first accessed and kept in a small cache,
+    so a report with thousands of fields only builds the pages that are actually viewed.
+    It behaves as a sequence of embeds and can be passed directly to :func:`dpytools.menus.arrows`.
+
     Parameters
     -----------
     embed: :class:`Embed`
@@ -189,14 +666,30 @@ class PaginatedEmbeds:
     fields_dict: :class:`dict`
         The dictionary containing name and values as key-value pair. Must not be empty.
     size: Optional[:class:`int`]
-        Number of field in each embed. Must be greater then 0. Defaults to 25.
+        Maximum number of fields in each embed. Must be greater then 0. Defaults to 25.
+        Pages are also closed before they go over the 6000 characters limit of an embed.
+        When there's more than one page the page number is added to the description and counted in both limits.
     inline: Optional[:class:`bool`]
         Bool variable if fields will be inline or not. Defaults to True.
-       
+    cache_size: Optional[:class:`int`]
+        Amount of rendered pages kept in memory. Defaults to 16.
+    oversize: Optional[:class:`str`]
+        What to do with fields whose name is over 256 characters or value over 1024:
+
+        - **'split'** (default) the value is continued in as many fields as needed.
+        - **'truncate'** the name and value are cut and end with "...".
+        - **'error'** raises :class:`ValueError`.
+
+    Raises
+    ------
+    ValueError
+        If the dictionary is empty, size is less than 1, a field is oversized with **oversize='error'**,
+        the base embed is too large to hold any field or its description leaves no room for the page number.
+
     Example
     -------
     ::
-        
+
         from dpytools.embeds import PaginatedEmbeds
         from dpytools.menus import arrows
         @bot.command(name='send-fields')
@@ -213,7 +706,20 @@ class PaginatedEmbeds:
 
     """
 
-    def __init__(self, embed: Embed, fields_dict: Dict[str, str], size: int = 25, inline: bool = True):
+    def __init__(self,
+                 embed: Embed,
+                 fields_dict: Dict[str, str],
+                 size: int = 25,
+                 inline: bool = True,
+                 cache_size: int = 16,
+                 oversize: str = 'split'):
+        if not fields_dict:
+            raise ValueError("Dictionary containing name and value can't be empty!")
+        if size < 1:
+            raise ValueError("Number of Embed fields can't be zero")
+        if oversize not in ('split', 'truncate', 'error'):
+            raise ValueError("oversize must be 'split', 'truncate' or 'error'")
+
         embed.clear_fields()  # Clearing the fields just in case embed is not empty
         self.embed = embed
         self.size: int = size
@@ -222,32 +728,57 @@ class PaginatedEmbeds:
 
         self.field_limit = 25
         self.char_limit = 6000
-        self._pages = []
-        self._add_embed(self.fields_dict)
-
-    def _clear(self):
-        """Clears the paginator to have no pages."""
-        self._pages = []
-
-    def _check_embed(self, embed: Embed, *chars: str):
+        self.oversize = oversize
+        self._fields = self._fit_fields(fields_dict)
+        self._starts = self._pack()
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+
+    def _fit_fields(self, fields_dict: Dict[str, str]) -> List[Tuple[str, str]]:
+        """Applies the **oversize** policy to names over 256 characters and values over 1024"""
+        fields = []
+        for name, value in fields_dict.items():
+            name, value = str(name), str(value)
+            if len(name) <= FIELD_NAME_LIMIT and len(value) <= FIELD_VALUE_LIMIT:
+                fields.append((name, value))
+            elif self.oversize == 'error':
+                raise ValueError(f'Field {name[:50]!r} exceeds the size limits of a field')
+            elif self.oversize == 'truncate' or len(value) <= FIELD_VALUE_LIMIT:
+                fields.append((_truncate(name, FIELD_NAME_LIMIT), _truncate(value, FIELD_VALUE_LIMIT)))
+            else:
+                name = _truncate(name, FIELD_NAME_LIMIT)
+                for i in range(0, len(value), FIELD_VALUE_LIMIT):
+                    fields.append((name if i == 0 else '\u200b', value[i:i + FIELD_VALUE_LIMIT]))
+        return fields
+
+    def _pack(self) -> array:
         """
-        Check if the embed is too big to be sent on discord
-
-        Parameters
-        ----------
-            embed: :class:`Embed`: 
-                The embed to check
-
-        Returns
-        -------
-            :class:`bool`
-                Will return **True** if the emebed isn't too large
+        Index of the first field of each page.
+        Pages are filled greedily up to **size** fields and the embed character limit,
+        keeping a running total instead of measuring the embed after each field.
         """
-        check = (
-                len(embed) + sum(len(char) for char in chars if char) < self.char_limit
-                and len(embed.fields) < self.field_limit
-        )
-        return check
+        number = len(f"`Page: {len(self._fields)}/{len(self._fields)}`\n")  # longest possible page number
+        base = len(self.embed) + number
+        if base + 2 > self.char_limit:
+            raise ValueError('The base embed leaves no room for fields')
+        max_fields = min(self.size, self.field_limit)
+
+        starts = array('L', [0])
+        count, chars = 0, base
+        for i, (name, value) in enumerate(self._fields):
+            length = len(name) + len(value)
+            if count == max_fields or (count and chars + length > self.char_limit):
+                starts.append(i)
+                count, chars = 0, base
+            if chars + length > self.char_limit:
+                raise ValueError(f'Field {name[:50]!r} does not fit in an embed with the base embed')
+            count += 1
+            chars += length
+
+        description = _length(self.embed.description)
+        if len(starts) > 1 and description + len(f"`Page: {len(starts)}/{len(starts)}`\n") > DESCRIPTION_LIMIT:
+            raise ValueError('The description of the base embed leaves no room for the page number')
+        return starts
 
     def _new_page(self) -> Embed:
         """
@@ -256,64 +787,43 @@ class PaginatedEmbeds:
         Returns:
             Embed: Return a new Embed for new page
         """
-        return Embed.from_dict(self.embed.to_dict())  # This convert discord.Embed to Embed and return it
-
-    def _add_page(self, page: Embed):
-        """
-        Add a page to the paginator
-
-        Parameters
-        ----------
-            page: :class:`Embed`
-                The page to add
-        """
-
-        self._pages.append(page)
-
-    def _chunks(self, fields_dict: Dict[str, str]) -> Dict[str, str]:
-        """Yield successive chunks of num size from dicts
-
-        Args:
-            fields_dict (dict): Dictionary containing name and value as key-value pair
-
-        Yields:
-            dict: dictionary with size :param num: containing name and value of each field
-        """
-
-        num = self.size
-        if not fields_dict:
-            raise ValueError("Dictionary containing name and value can't be empty!")
-
-        if num < 1:
-            raise ValueError("Number of Embed fields can't be zero")
-
-        field_iter = iter(fields_dict)
-        for _ in range(0, len(fields_dict), num):
-            yield {k: fields_dict[k] for k in islice(field_iter, num)}
-
-    def _add_embed(self, fields_dict: dict):
-        """Add embeds to pages
-
-        Args:
-            fields_dict :- Dictionary containing name and value as key-value pair
-        """
-        for field_dict_chunk in self._chunks(fields_dict):
-            field_dict_chunk: dict  # just to appease the linter
-            embed = self._new_page()
-
-            embed.add_fields(**field_dict_chunk)  # dict should be passed as kwargs or it will be taken as bool
-            self._add_page(embed)
+        return _clone(self.embed)
+
+    def _render(self, index: int) -> Embed:
+        """Builds the page at index"""
+        start = self._starts[index]
+        end = self._starts[index + 1] if index + 1 < len(self._starts) else len(self._fields)
+        page = self._new_page()
+        page._fields = [{'inline': self.inline, 'name': name, 'value': value}
+                        for name, value in self._fields[start:end]]
+        page._recount()
+        if len(self._starts) > 1:
+            number = f"`Page: {index + 1}/{len(self._starts)}`"
+            page.description = f"{number}\n{page.description}" if page.description else number
+        return page
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __getitem__(self, index: int) -> Embed:
+        if index < 0:
+            index += len(self._starts)
+        if not 0 <= index < len(self._starts):
+            raise IndexError('page index out of range')
+        if index in self._cache:
+            self._cache.move_to_end(index)
+            return self._cache[index]
+        page = self._render(index)
+        if self._cache_size:
+            self._cache[index] = page
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return page
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
 
     @property
-    def pages(self):
+    def pages(self) -> List[Embed]:
         """Returns the rendered list of pages"""
-        if len(self._pages) == 1:
-            return self._pages
-        lst = []
-        for page_no, page in enumerate(self._pages, start=1):
-            page: discord.Embed
-            page.description = (
-                f"`Page: {page_no}/{len(self._pages)}`\n{page.description}"
-            )
-            lst.append(page)
-        return lst
+        return list(self)
@@ -35,4 +35,9 @@ class OutsidePermittedDatetime(CheckFailure):
     pass
 
 class UserAnswerParsingError(CommandError):
-    pass
\ No newline at end of file
+    pass
+
+class RateLimited(CheckFailure):
+    def __init__(self, retry_after: float, message: str = None):
+        self.retry_after = retry_after
+        super().__init__(message or f'You are being rate limited. Try again in {retry_after:.2f}s.')
@@ -6,17 +6,21 @@ All menus are reaction based.
 """
 
 import asyncio
+from collections import OrderedDict, deque
 from copy import copy
 from inspect import isawaitable
-from typing import List, Optional, Union, Callable
+from typing import Any, List, Optional, Union, Callable, Awaitable, AsyncIterable, Sequence, Tuple
 
 import discord
 from discord import Embed
 from discord.ext import commands
 from discord.ext.commands import Context, Converter
 
-from dpytools import EmojiNumbers, Emoji, chunkify_string_list, Color
+from dpytools import EmojiNumbers, Emoji, chunkify_string_list, Color, _silent_except
+from dpytools.cleanup import delete_messages, CleanupReport
 from dpytools.errors import UserAnswerParsingError
+from dpytools.routers import ReactionRouter
+from dpytools.scheduler import RESTScheduler
 from dpytools.waiters import BaseLock
 
 __all__ = (
@@ -24,28 +28,283 @@ __all__ = (
     'arrows',
     'confirm',
     'multichoice',
-    'TextMenu'
+    'TextMenu',
+    'MenuMetrics',
 )
 
 
-async def try_clear_reactions(msg):
+async def try_clear_reactions(msg, scheduler: Optional[RESTScheduler] = None):
     """helper function to remove reactions excepting forbidden
-    either by context being a dm_channel or bot lacking perms"""
+    either by context being a dm_channel or bot lacking perms.
+    If a :class:`dpytools.scheduler.RESTScheduler` is passed the call goes through it"""
 
     if msg.guild:
         try:
-            await msg.clear_reactions()
+            if scheduler is not None:
+                await scheduler.clear_reactions(msg)
+            else:
+                await msg.clear_reactions()
         except discord.errors.Forbidden:
             pass
 
 
+class MenuMetrics:
+    """
+    Timings of a single menu run.
+    Pass an instance to the **metrics** parameter of a reaction menu and it will be filled as the menu runs.
+
+    Timestamps are taken from the event loop's monotonic clock and remain **None** until reached.
+
+    Attributes
+    ----------
+    started_at: :class:`Optional[float]`
+        When the menu was called
+    sent_at: :class:`Optional[float]`
+        When the menu message was sent
+    interactive_at: :class:`Optional[float]`
+        When the menu started listening for reactions
+    seeded_at: :class:`Optional[float]`
+        When all of the menu's reactions had been added
+    interactions: :class:`int`
+        The amount of reactions the menu accepted
+    """
+    __slots__ = ('started_at', 'sent_at', 'interactive_at', 'seeded_at', 'interactions')
+
+    def __init__(self):
+        self.started_at: Optional[float] = None
+        self.sent_at: Optional[float] = None
+        self.interactive_at: Optional[float] = None
+        self.seeded_at: Optional[float] = None
+        self.interactions: int = 0
+
+    @staticmethod
+    def now() -> float:
+        """The current time of the running event loop"""
+        return asyncio.get_running_loop().time()
+
+    @property
+    def time_to_interactive(self) -> Optional[float]:
+        """Seconds from the call to the menu listening for reactions"""
+        if self.started_at is not None and self.interactive_at is not None:
+            return self.interactive_at - self.started_at
+
+    @property
+    def time_to_seeded(self) -> Optional[float]:
+        """Seconds from the call to all of the menu's reactions being added"""
+        if self.started_at is not None and self.seeded_at is not None:
+            return self.seeded_at - self.started_at
+
+    def __repr__(self):
+        return (f"MenuMetrics(time_to_interactive={self.time_to_interactive}, "
+                f"time_to_seeded={self.time_to_seeded}, interactions={self.interactions})")
+
+
+class _ReactionRow:
+    """
+    Keeps track of the reactions the bot placed on a menu message so they can be updated by difference
+    instead of clearing and adding them all again.
+    Updates run in a background task so the menu can listen while reactions are still being added.
+    This class is not intended to be instantiated or subclassed
+    """
+    __slots__ = ('msg', 'me', 'scheduler', 'current', 'wanted', 'clicks', 'can_remove_others', 'metrics', '_task')
+
+    def __init__(self,
+                 msg: discord.Message,
+                 me: Union[discord.Member, discord.ClientUser],
+                 scheduler: RESTScheduler,
+                 metrics: Optional[MenuMetrics] = None):
+        self.msg = msg
+        self.me = me
+        self.scheduler = scheduler
+        self.current: List[str] = []
+        self.wanted: List[str] = []
+        self.clicks: List[Tuple[str, int]] = []
+        self.can_remove_others = bool(msg.guild) and msg.channel.permissions_for(msg.guild.me).manage_messages
+        self.metrics = metrics
+        self._task: Optional[asyncio.Task] = None
+
+    def update(self, wanted: List[str]):
+        """
+        Sets the reactions the message should have and starts updating it in the background if needed.
+        A running update picks up the new target so only one task touches the message at a time.
+        """
+        self.wanted = [getattr(emoji, 'value', emoji) for emoji in wanted]
+        self._start()
+
+    def remove_user_reaction(self, emoji: str, user_id: int):
+        """
+        Schedules the removal of a single reaction made by a user so the same button can be clicked again.
+        If the bot lacks the permissions to do so the reaction is left and the row stays as is.
+        """
+        if self.can_remove_others:
+            self.clicks.append((emoji, user_id))
+            self._start()
+
+    def _start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._sync())
+
+    async def _sync(self):
+        """
+        Works one call at a time until the message matches the row,
+        user reactions are removed first so buttons become clickable again as soon as possible.
+        """
+        try:
+            while True:
+                if self.clicks:
+                    emoji, user_id = self.clicks.pop(0)
+                    try:
+                        await self.scheduler.remove_reaction(self.msg, emoji, discord.Object(id=user_id))
+                    except discord.errors.Forbidden:
+                        self.can_remove_others = False
+                        self.clicks.clear()
+                    except discord.errors.NotFound:
+                        pass
+                elif (extra := next((e for e in self.current if e not in self.wanted), None)) is not None:
+                    await self.scheduler.remove_reaction(self.msg, extra, self.me)
+                    self.current.remove(extra)
+                elif (missing := next((e for e in self.wanted if e not in self.current), None)) is not None:
+                    await self.scheduler.add_reaction(self.msg, missing)
+                    self.current.append(missing)
+                else:
+                    break
+        except discord.errors.HTTPException:
+            return  # the message is gone or the bot can't react, the menu will time out as usual
+        if self.metrics is not None and self.metrics.seeded_at is None:
+            self.metrics.seeded_at = self.metrics.now()
+
+    def cancel(self):
+        """Stops any update in progress, used when the menu closes"""
+        if self._task is not None:
+            self._task.cancel()
+
+
+class _PageSource:
+    """
+    Gives uniform, lazy access to the pages of an **arrows** menu.
+    Pages from callables are kept in a bounded LRU cache, pages from async iterators are pulled only when reached
+    and only the last **cache_size** of them are kept, older ones can't be shown again.
+    This class is not intended to be instantiated or subclassed
+    """
+    __slots__ = ('count', '_get', '_iterator', '_pulled', '_pulled_count', '_cache', '_cache_size')
+
+    def __init__(self,
+                 pages: Union[Sequence[Embed], Callable[[int], Union[Embed, Awaitable[Embed]]], AsyncIterable[Embed]],
+                 count: Optional[int] = None,
+                 cache_size: int = 16):
+        self._get = None
+        self._iterator = None
+        self._pulled = deque(maxlen=max(cache_size, 1))
+        self._pulled_count = 0
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self.count = count
+
+        if hasattr(pages, '__aiter__'):
+            self._iterator = pages.__aiter__()
+        elif callable(pages):
+            self._get = pages
+        else:
+            self._get = pages.__getitem__
+            self._cache_size = 0  # sequences already hold their pages
+            self.count = len(pages)
+
+    async def get(self, index: int) -> Optional[Embed]:
+        """Returns the page at index or None if there's no such page"""
+        if index < 0 or (self.count is not None and index >= self.count):
+            return None
+
+        if self._iterator is not None:
+            while self._pulled_count <= index:
+                try:
+                    self._pulled.append(await self._iterator.__anext__())
+                except StopAsyncIteration:
+                    self.count = self._pulled_count
+                    return None
+                self._pulled_count += 1
+            first = self._pulled_count - len(self._pulled)
+            if index < first:  # dropped to bound memory, the iterator can't give it again
+                return None
+            return self._pulled[index - first]
+
+        if index in self._cache:
+            self._cache.move_to_end(index)
+            return self._cache[index]
+
+        try:
+            page = self._get(index)
+            if isawaitable(page):
+                page = await page
+        except IndexError:
+            self.count = index
+            return None
+
+        if self._cache_size:
+            self._cache[index] = page
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return page
+
+
+async def _wait_for_reaction(ctx: commands.Context,
+                             msg: discord.Message,
+                             check: Callable[[discord.RawReactionActionEvent], bool],
+                             timeout: Optional[float],
+                             use_router: bool) -> discord.RawReactionActionEvent:
+    """Waits for a reaction on msg either through the bot's ReactionRouter or a dedicated wait_for listener"""
+    if use_router:
+        return await ReactionRouter.of(ctx.bot).wait_for(msg.id, check=check, timeout=timeout)
+
+    def _check(payload):
+        return payload.message_id == msg.id and check(payload)
+
+    return await ctx.bot.wait_for('raw_reaction_add', check=_check, timeout=timeout)
+
+
+class _ListenerSession:
+    """This class is not intended to be instantiated or subclassed"""
+    __slots__ = ('ctx', 'msg', 'check', 'timeout')
+
+    def __init__(self, ctx, msg, check, timeout):
+        self.ctx = ctx
+        self.msg = msg
+        self.check = check
+        self.timeout = timeout
+
+    async def next(self) -> discord.RawReactionActionEvent:
+        return await _wait_for_reaction(self.ctx, self.msg, self.check, self.timeout, False)
+
+    def close(self):
+        pass
+
+
+def _reaction_session(ctx: commands.Context,
+                      msg: discord.Message,
+                      check: Callable[[discord.RawReactionActionEvent], bool],
+                      timeout: Optional[float],
+                      use_router: bool):
+    """
+    Listens to the reactions of a menu for its whole life.
+    Through the router the idle timeout is a single timer in the bot's wheel reset on each reaction.
+    """
+    if use_router:
+        return ReactionRouter.of(ctx.bot).session(msg.id, check, timeout)
+    return _ListenerSession(ctx, msg, check, timeout)
+
+
 async def arrows(ctx: commands.Context,
-                 embed_list: List[Embed],
+                 embed_list: Union[Sequence[Embed],
+                                   Callable[[int], Union[Embed, Awaitable[Embed]]],
+                                   AsyncIterable[Embed]],
                  content: Optional[str] = None,
                  head: int = 0,
                  timeout: int = 30,
                  closed_embed: Optional[Embed] = None,
-                 channel: Optional[discord.abc.Messageable] = None):
+                 channel: Optional[discord.abc.Messageable] = None,
+                 use_router: bool = False,
+                 page_count: Optional[int] = None,
+                 cache_size: int = 16,
+                 metrics: Optional[MenuMetrics] = None):
     """
     Sends multiple embeds with a reaction navigation menu.
 
@@ -53,8 +312,15 @@ async def arrows(ctx: commands.Context,
     ----------
     ctx: :class:`discord.ext.commands.Context`
         The context where this function is called.
-    embed_list: :class:`List[Embed]`
-        An ordered list containing the embeds to be sent.
+    embed_list: :class:`Union[Sequence[Embed], Callable[[int], Embed], AsyncIterable[Embed]]`
+        The pages to be displayed. Any of:
+
+        - An ordered list (or any sequence) containing the embeds to be sent.
+        - A function or coroutine function that takes the index of a page and returns its embed.
+          It may raise :class:`IndexError` to signal the end if **page_count** is unknown.
+          Only the pages the user visits are built.
+        - An async iterator of embeds, pulled one page at a time as the user moves forward.
+          Only the last **cache_size** pages pulled can be shown again, the user can't go back further.
     content: :class:`str`
         A static string. This wont change with pagination.
         It will be cleared when its closed, but will persist on pause
@@ -68,6 +334,29 @@ async def arrows(ctx: commands.Context,
         Defaults to plain embed with "Closed by user" in description
     channel: :class:`discord.abc.Messageable`
         The channel to be used for displaying the menu, defaults to ctx.channel.
+    use_router: :class:`bool`
+        If True the menu listens through the bot's :class:`dpytools.routers.ReactionRouter`
+        instead of registering its own **wait_for** listener. Recommended for bots with many open menus.
+        The idle timeout is then a single timer in the bot's :class:`dpytools.timers.TimerWheel`,
+        reset on every interaction.
+    page_count: :class:`Optional[int]`
+        The total amount of pages when **embed_list** is a function or an async iterator.
+        If unknown the "last page" button is not displayed.
+    cache_size: :class:`int`
+        The maximum amount of pages returned by a function or pulled from an async iterator kept in memory.
+        Defaults to 16.
+    metrics: :class:`Optional[MenuMetrics]`
+        An instance that will be filled with the timings of this menu.
+
+    .. note::
+
+        Reactions are added in the background, the menu listens as soon as the message is sent.
+
+    .. note::
+
+        The navigation reactions stay the same on every page so turning a page only edits the message.
+        If the bot has **manage_messages** the user's reaction is removed after each click,
+        otherwise the user has to remove it before clicking the same button again.
 
     Example
     -------
@@ -78,77 +367,90 @@ async def arrows(ctx: commands.Context,
         async def test(ctx):
             embed_list = [Embed(...), Embed(...), ...)
             await arrows(ctx, embed_list)
+
+        @bot.command()
+        async def search(ctx, *, query):
+            async def page(i):
+                results = await database.search(query, offset=i * 10, limit=10)
+                return Embed(description='\\n'.join(results))
+            await arrows(ctx, page, page_count=await database.count(query) // 10 + 1)
     """
+    metrics = metrics or MenuMetrics()
+    metrics.started_at = metrics.now()
     channel = channel or ctx.channel
     closed_embed = closed_embed or Embed(description="Closed by user", color=Color.RED)
+    source = _PageSource(embed_list, page_count, cache_size)
+    scheduler = RESTScheduler.of(ctx.bot)
 
-    if len(embed_list) == 1:
-        return await channel.send(content=content, embed=embed_list[0])
-
-    def get_reactions(_head: int):
-        _to_react = []
-        emb_range = range(len(embed_list))
-        if _head - 2 in emb_range:
-            _to_react.append(Emoji.LAST_TRACK.value)
-        if _head - 1 in emb_range:
-            _to_react.append(Emoji.REVERSE.value)
-        if _head + 1 in emb_range:
-            _to_react.append(Emoji.PLAY.value)
-        if _head + 2 in emb_range:
-            _to_react.append(Emoji.NEXT_TRACK.value)
-        _to_react += [Emoji.PAUSE.value, Emoji.X.value]
-        return _to_react
-
-    msg = await channel.send(content=content, embed=embed_list[head])
-
-    to_react = get_reactions(head)
-    for emoji in to_react:
-        await msg.add_reaction(emoji)
+    if (embed := await source.get(head)) is None:
+        raise IndexError(f'There is no page with index {head}')
+
+    if source.count == 1:
+        return await scheduler.send(channel, content=content, embed=embed)
+
+    if source.count is None:
+        to_react = [Emoji.LAST_TRACK, Emoji.REVERSE, Emoji.PLAY, Emoji.PAUSE, Emoji.X]
+    elif source.count > 2:
+        to_react = [Emoji.LAST_TRACK, Emoji.REVERSE, Emoji.PLAY, Emoji.NEXT_TRACK, Emoji.PAUSE, Emoji.X]
+    else:
+        to_react = [Emoji.REVERSE, Emoji.PLAY, Emoji.PAUSE, Emoji.X]
+
+    msg = await scheduler.send(channel, content=content, embed=embed)
+    metrics.sent_at = metrics.now()
+    row = _ReactionRow(msg, ctx.me, scheduler, metrics)
+    row.update(to_react)
 
     def check(payload_):
-        return all([
-            msg.id == payload_.message_id,
-            payload_.user_id == ctx.author.id,
-            payload_.emoji.name in to_react,
-        ])
+        return payload_.user_id == ctx.author.id and payload_.emoji.name in to_react
 
     def get_head(head_: int, emoji_) -> Union[bool, int]:
         actions = {
             Emoji.LAST_TRACK: 0,
             Emoji.REVERSE: head_ - 1 if head_ else 0,
-            Emoji.PLAY: head_ + 1 if head_ < len(embed_list) - 1 else len(embed_list),
-            Emoji.NEXT_TRACK: len(embed_list) - 1,
+            Emoji.PLAY: head_ + 1,
+            Emoji.NEXT_TRACK: source.count - 1 if source.count else head_,
             Emoji.X: False,
             Emoji.PAUSE: True,
         }
         return actions[emoji_]
 
-    while True:
-        try:
-            payload = await ctx.bot.wait_for('raw_reaction_add', timeout=timeout, check=check)
-        except asyncio.TimeoutError:
-            return await try_clear_reactions(msg)
-        else:
-            head = get_head(head, payload.emoji.name)
-            if head is True:  # pause emoji triggered
-                return await try_clear_reactions(msg)
+    session = _reaction_session(ctx, msg, check, timeout, use_router)
+    metrics.interactive_at = metrics.now()
+    try:
+        while True:
+            try:
+                payload = await session.next()
+            except asyncio.TimeoutError:
+                row.cancel()
+                return await try_clear_reactions(msg, scheduler)
+            else:
+                metrics.interactions += 1
+                new_head = get_head(head, payload.emoji.name)
+                if new_head is True:  # pause emoji triggered
+                    row.cancel()
+                    return await try_clear_reactions(msg, scheduler)
 
-            if head is False:  # X emoji triggered
-                await try_clear_reactions(msg)
-                return await msg.edit(content=None, embed=closed_embed, delete_after=10)
+                if new_head is False:  # X emoji triggered
+                    row.cancel()
+                    await try_clear_reactions(msg, scheduler)
+                    return await scheduler.edit(msg, content=None, embed=closed_embed, delete_after=10)
 
-            else:
-                await try_clear_reactions(msg)
-                await msg.edit(embed=embed_list[head])
-                to_react = get_reactions(head)
-                for emoji in to_react:
-                    await msg.add_reaction(emoji)
+                else:
+                    if new_head != head and (embed := await source.get(new_head)) is not None:
+                        head = new_head
+                        await scheduler.edit(msg, embed=embed)
+                    row.remove_user_reaction(payload.emoji.name, payload.user_id)
+    finally:
+        row.cancel()
+        session.close()
 
 
 async def confirm(ctx: commands.Context,
                   msg: discord.Message,
                   lock: Union[discord.Member, discord.Role, bool, None] = True,
-                  timeout: int = 30) -> Optional[bool]:
+                  timeout: int = 30,
+                  use_router: bool = False,
+                  metrics: Optional[MenuMetrics] = None) -> Optional[bool]:
     """
     Helps to create a reaction menu to confirm an action.
 
@@ -169,6 +471,11 @@ async def confirm(ctx: commands.Context,
             - ANY user with target role will be able to react.
     timeout: :class:ìnt` (seconds)
         Timeout before the menu closes.
+    use_router: :class:`bool`
+        If True the menu listens through the bot's :class:`dpytools.routers.ReactionRouter`
+    metrics: :class:`Optional[MenuMetrics]`
+        An instance that will be filled with the timings of this menu.
+        **sent_at** is the time the menu was called since the message already exists.
 
     Returns
     -------
@@ -193,43 +500,44 @@ async def confirm(ctx: commands.Context,
             else:
                 await msg.edit(content='Timeout')
     """
-
+    metrics = metrics or MenuMetrics()
+    metrics.started_at = metrics.sent_at = metrics.now()
     emojis = ['👍', '❌']
-    for emoji in emojis:
-        await msg.add_reaction(emoji)
+    scheduler = RESTScheduler.of(ctx.bot)
+    row = _ReactionRow(msg, ctx.me, scheduler, metrics)
+    row.update(emojis)
 
     def check(payload):
-        _checks = [
-            payload.user_id != ctx.bot.user.id,
-            payload.emoji.name in emojis,
-            payload.message_id == msg.id,
-        ]
+        if payload.user_id == ctx.bot.user.id or payload.emoji.name not in emojis:
+            return False
         if lock:
             if isinstance(lock, bool):
-                _checks.append(payload.user_id == ctx.author.id)
+                return payload.user_id == ctx.author.id
             elif isinstance(lock, discord.Member):
-                _checks.append(payload.user_id == lock.id)
+                return payload.user_id == lock.id
             elif isinstance(lock, discord.Role):
-                _checks.append(lock in ctx.guild.get_member(payload.user_id).roles)
-        return all(_checks)
+                return lock in ctx.guild.get_member(payload.user_id).roles
+        return True
 
+    metrics.interactive_at = metrics.now()
     try:
-        payload = await ctx.bot.wait_for('raw_reaction_add', check=check, timeout=timeout)
+        payload = await _wait_for_reaction(ctx, msg, check, timeout, use_router)
     except asyncio.TimeoutError:
-        await try_clear_reactions(msg)
         return None
     else:
-        await try_clear_reactions(msg)
-        if payload.emoji.name == '👍':
-            return True
-        else:
-            return False
+        metrics.interactions += 1
+        return payload.emoji.name == '👍'
+    finally:
+        row.cancel()
+        await try_clear_reactions(msg, scheduler)
 
 
 async def multichoice(ctx: Context,
                       options: List[str],
                       timeout: int = 60,
-                      base_embed: Embed = Embed()
+                      base_embed: Embed = Embed(),
+                      use_router: bool = False,
+                      metrics: Optional[MenuMetrics] = None,
                       ) -> Optional[str]:
     """
     Takes a list of strings and creates a selection menu.
@@ -248,6 +556,10 @@ async def multichoice(ctx: Context,
         An optional embed object to take as a blueprint.
             - The menu will only modify the footer and description.
             - All other fields are free to be set by you.
+    use_router: :class:`bool`
+        If True the menu listens through the bot's :class:`dpytools.routers.ReactionRouter`
+    metrics: :class:`Optional[MenuMetrics]`
+        An instance that will be filled with the timings of this menu.
 
     Example
     -------
@@ -275,6 +587,8 @@ async def multichoice(ctx: Context,
     elif any([len(opt) > 2000 for opt in options]):
         raise ValueError("The maximum length for any option is 2000")
 
+    metrics = metrics or MenuMetrics()
+    metrics.started_at = metrics.now()
     multiple = len(options) > 10
     head = 0
     embeds = []
@@ -301,15 +615,10 @@ async def multichoice(ctx: Context,
         return list(nums)[:len(_chunk)]
 
     def get_reactions():
-        to_react = get_nums(embeds[head][0])
-        if multiple:
-            if head not in [0, len(embeds) - 1]:
-                to_react = [Emoji.LAST_TRACK, Emoji.REVERSE] + to_react + [Emoji.PLAY, Emoji.NEXT_TRACK]
-            elif head == 0:
-                to_react = to_react + [Emoji.PLAY, Emoji.NEXT_TRACK]
-            elif head == len(embeds) - 1:
-                to_react = [Emoji.LAST_TRACK, Emoji.REVERSE] + to_react
-        return to_react + [Emoji.X]
+        # navigation and close buttons go first and never change,
+        # only the trailing numbers differ between pages so the row can be updated by difference.
+        to_react = [Emoji.LAST_TRACK, Emoji.REVERSE, Emoji.PLAY, Emoji.NEXT_TRACK] if multiple else []
+        return to_react + [Emoji.X] + get_nums(embeds[head][0])
 
     def adjust_head(head_: int, emoji: str):
         if not multiple:
@@ -325,56 +634,86 @@ async def multichoice(ctx: Context,
                 head_ = len(embeds) - 1
         return head_
 
-    def check(reaction: discord.Reaction,
-              user: Union[discord.User, discord.Member]):
-
-        return all([
-            user != ctx.bot.user,
-            user == ctx.author,
-            ctx.channel == reaction.message.channel,
-            reaction.emoji in to_react,
-        ])
+    def check(payload: discord.RawReactionActionEvent):
+        return payload.user_id == ctx.author.id and payload.emoji.name in to_react
 
     to_react = get_reactions()
     first_embed = embeds[0][1]
     first_embed.set_footer(text=f"Page 1/{len(embeds)}")
-    msg = await ctx.send(embed=first_embed)
-
-    for reaction in to_react:
-        await msg.add_reaction(reaction)
-
-    while True:
-        try:
-            reaction, user = await ctx.bot.wait_for('reaction_add', check=check, timeout=timeout)
-        except asyncio.TimeoutError:
-            await msg.delete()
-            return
-        else:
-            emoji = reaction.emoji
-            if emoji == Emoji.X:
-                await msg.delete()
+    scheduler = RESTScheduler.of(ctx.bot)
+    msg = await scheduler.send(ctx.channel, embed=first_embed)
+    metrics.sent_at = metrics.now()
+    row = _ReactionRow(msg, ctx.me, scheduler, metrics)
+    row.update(to_react)
+
+    session = _reaction_session(ctx, msg, check, timeout, use_router)
+    metrics.interactive_at = metrics.now()
+    try:
+        while True:
+            try:
+                payload = await session.next()
+            except asyncio.TimeoutError:
+                row.cancel()
+                await scheduler.delete(msg)
                 return
             else:
-                if emoji in nums:
-                    await msg.delete()
-                    return embeds[head][0][nums[emoji]]
+                metrics.interactions += 1
+                emoji = payload.emoji.name
+                if emoji == Emoji.X:
+                    row.cancel()
+                    await scheduler.delete(msg)
+                    return
                 else:
-                    head = adjust_head(head, emoji)
-                    next_embed = embeds[head][1]
-                    next_embed.set_footer(text=f"Page {head + 1}/{len(embeds)}")
-                    await msg.edit(embed=next_embed)
-                    try:
-                        await msg.clear_reactions()
-                    except discord.errors.Forbidden:
-                        pass
+                    if emoji in nums:
+                        row.cancel()
+                        await scheduler.delete(msg)
+                        return embeds[head][0][nums[emoji]]
                     else:
+                        new_head = adjust_head(head, emoji)
+                        if new_head != head:
+                            head = new_head
+                            next_embed = embeds[head][1]
+                            next_embed.set_footer(text=f"Page {head + 1}/{len(embeds)}")
+                            await scheduler.edit(msg, embed=next_embed)
+                        row.remove_user_reaction(emoji, payload.user_id)
                         to_react = get_reactions()
-                        for reaction in to_react:
-                            await msg.add_reaction(reaction)
+                        row.update(to_react)
+    finally:
+        row.cancel()
+        session.close()
+
+
+_NO_ANSWER = object()
+_cleanup_tasks = set()  # strong references to the background cleanups
+
+
+def _compile_parser(parser: Union[Converter, Callable, None]) -> Optional[Callable[[Context, str], Awaitable]]:
+    """
+    Resolves the kind of parser once and returns a coroutine function `convert(ctx, content)`
+    so answers don't go through the isinstance checks.
+    """
+    if parser is None:
+        return None
+    if isinstance(parser, type) and issubclass(parser, Converter):
+        parser = parser()
+    if isinstance(parser, Converter):
+        return parser.convert
+    if asyncio.iscoroutinefunction(parser):
+        async def convert(ctx, content):
+            return await parser(content)
+    else:
+        async def convert(ctx, content):
+            answer = parser(content)
+            if isawaitable(answer):
+                answer = await answer
+            return answer
+    return convert
 
 
 class _QuestionData:
     """This class is not intended to be instantiated or subclassed"""
+    __slots__ = ('question', 'embed', 'parser', 'convert', 'parse_fail_response', 'parse_fail_embed')
+
     def __init__(self,
                  *,
                  question: str = None,
@@ -383,14 +722,13 @@ class _QuestionData:
                  parse_fail_response: str = None,
                  parse_fail_embed: discord.Embed = None
                  ):
-        self.failed = False
-
         if not question and not embed:
             raise ValueError('Either question or embed are required to construct the instance')
 
         self.question = question
         self.embed = embed
         self.parser = parser
+        self.convert = _compile_parser(parser)
         self.parse_fail_response = parse_fail_response
         self.parse_fail_embed = parse_fail_embed
 
@@ -398,6 +736,164 @@ class _QuestionData:
         return f"QuestionData(text={self.question})"
 
 
+class _TextMenuSession:
+    """
+    The state of a single call of a :class:`TextMenu`.
+
+    This class is not intended to be instantiated or subclassed
+    """
+    __slots__ = ('menu', 'ctx', 'questions', 'check', 'messages', 'failed')
+
+    def __init__(self, menu: 'TextMenu', ctx: Context):
+        self.menu = menu
+        self.ctx = ctx
+        self.questions = menu._questions
+        self.check = BaseLock(ctx, lock=menu.lock)
+        self.messages = []
+        self.failed: Optional[str] = None  # content of the failed answer to the current question
+
+    async def try_to_clean(self):
+        """
+        Deletes the messages of the menu in a background task so the call returns right away
+        """
+        if self.menu.cleanup and self.messages:
+            task = asyncio.create_task(self._clean(self.messages))
+            _cleanup_tasks.add(task)
+            task.add_done_callback(_cleanup_tasks.discard)
+
+    async def _clean(self, messages: List[discord.Message]):
+        report = await delete_messages(messages, scheduler=RESTScheduler.of(self.ctx.bot))
+        if self.menu.on_cleanup is not None:
+            await _silent_except(self.menu.on_cleanup, report)
+
+    async def ask(self, question: _QuestionData):
+        """Asks an individual question"""
+        if self.failed is None:
+            msg_text, msg_embed = question.question, question.embed
+        else:
+            msg_text = (question.parse_fail_response.format(self.failed)
+                        if question.parse_fail_response else None)
+            msg_embed = question.parse_fail_embed
+        self.messages.append(await RESTScheduler.of(self.ctx.bot).send(self.ctx.channel,
+                                                                       content=msg_text,
+                                                                       embed=msg_embed))
+        answer_msg = await self.check.wait(self.menu.timeout)
+        self.messages.append(answer_msg)
+        if answer_msg.content.lower().strip() == self.menu.stop:
+            return False
+        if question.convert is None:
+            return answer_msg.content
+        try:
+            return await question.convert(self.ctx, answer_msg.content)
+        except Exception as e:
+            self.failed = answer_msg.content
+            raise UserAnswerParsingError(f"Failed to parse {question}") from e
+
+    async def run(self):
+        answers = []
+        for question in self.questions:
+            self.failed = None
+            answer = _NO_ANSWER
+            while answer is _NO_ANSWER:
+                try:
+                    answer = await self.ask(question)
+                    if answer is False:
+                        await self.try_to_clean()
+                        return answer
+                except asyncio.TimeoutError:
+                    await self.try_to_clean()
+                    return
+                except UserAnswerParsingError as error:
+                    if not self.menu.retry_parse_fail:
+                        await self.try_to_clean()
+                        raise error
+            answers.append(answer)
+
+        await self.try_to_clean()
+        return answers
+
+    def split(self, content: str) -> List[str]:
+        """Splits a batch reply into answers"""
+        if self.menu.delimiter is None:
+            parts = content.splitlines()
+        else:
+            parts = content.split(self.menu.delimiter)
+        answers = [part.strip() for part in parts]
+        while answers and not answers[-1]:  # a trailing line break or delimiter isn't an answer
+            answers.pop()
+        return answers
+
+    def batch_prompt(self, pending: List[int], failed: dict, notice: Optional[str] = None) -> str:
+        """Numbered list of the pending questions, with the fail response of those that failed"""
+        lines = [notice] if notice else []
+        for position, index in enumerate(pending, 1):
+            question = self.questions[index]
+            parts = [f"**{position}.**"]
+            embed = question.embed
+            # the first text the question has, embed attributes may be Embed.Empty
+            if text := next((t for t in (question.question, embed and embed.title, embed and embed.description)
+                             if t), None):
+                parts.append(str(text))
+            if index in failed and question.parse_fail_response:
+                parts.append(f"({question.parse_fail_response.format(failed[index])})")
+            lines.append(' '.join(parts))
+        separator = 'one per line' if self.menu.delimiter is None else f'separated by `{self.menu.delimiter}`'
+        lines.append(f"Answer in a single message, {separator}.")
+        return '\n'.join(lines)
+
+    async def convert(self, question: _QuestionData, content: str):
+        if question.convert is None:
+            return content
+        return await question.convert(self.ctx, content)
+
+    async def run_batch(self):
+        """Asks every question in one message and parses the answers of a single reply concurrently"""
+        answers = [_NO_ANSWER] * len(self.questions)
+        pending = list(range(len(self.questions)))
+        failed = {}
+        notice = None
+        scheduler = RESTScheduler.of(self.ctx.bot)
+        while pending:
+            prompt = self.batch_prompt(pending, failed, notice)
+            self.messages.append(await scheduler.send(self.ctx.channel, content=prompt))
+            try:
+                answer_msg = await self.check.wait(self.menu.timeout)
+            except asyncio.TimeoutError:
+                await self.try_to_clean()
+                return
+            self.messages.append(answer_msg)
+            if answer_msg.content.lower().strip() == self.menu.stop:
+                await self.try_to_clean()
+                return False
+
+            parts = self.split(answer_msg.content)
+            if len(parts) != len(pending):
+                notice = f"Expected {len(pending)} answers, got {len(parts)}"
+                if not self.menu.retry_parse_fail:
+                    await self.try_to_clean()
+                    raise UserAnswerParsingError(notice)
+                failed = {}
+                continue
+            notice = None
+
+            results = await asyncio.gather(*(self.convert(self.questions[index], part)
+                                             for index, part in zip(pending, parts)),
+                                           return_exceptions=True)
+            failed = {}
+            for index, part, result in zip(pending, parts, results):
+                if isinstance(result, Exception):
+                    if not self.menu.retry_parse_fail:
+                        await self.try_to_clean()
+                        raise UserAnswerParsingError(f"Failed to parse {self.questions[index]}") from result
+                    failed[index] = part
+                else:
+                    answers[index] = result
+            pending = list(failed)
+
+        await self.try_to_clean()
+        return answers
+
+
 class TextMenu:
     """
     Constructs the menu instance
@@ -418,8 +914,21 @@ class TextMenu:
         timeout: **int** (Default **60**)
             The amount of time to wait for each question.
             If a timeout is reached, the menu is cancelled and cleaned up and returns None
-        cleanup: **bool** (Default **True**)
-            Whether to clean up messages or not
+        cleanup: **bool** (Default **False**)
+            Whether to clean up messages or not.
+            Messages are deleted in the background with :func:`dpytools.cleanup.delete_messages`
+            after the call returns.
+        on_cleanup: **Optional[Callable[[CleanupReport], Any]]** (Default **None**)
+            Function or coroutine function called with the :class:`dpytools.cleanup.CleanupReport`
+            once the messages of a call are deleted.
+        retry_parse_fail: **bool** (Default **False**)
+            Whether to ask again the questions whose parser failed instead of raising :class:`UserAnswerParsingError`
+        batch: **bool** (Default **False**)
+            If **True** all questions are sent in a single message and the user answers all of them in a single reply.
+            The answers are parsed concurrently and only the ones that failed are asked again.
+            Questions are displayed with their text, or the title of their embed.
+        delimiter: **Optional[str]** (Default **None**)
+            Separator of the answers in batch mode. By default each line is an answer.
 
     .. note::
 
@@ -429,6 +938,19 @@ class TextMenu:
 
         This way you can differentiate the output reasons
 
+    The menu only holds its questions, the state of each call lives in its own session.
+    A single instance can be created once and shared by any amount of concurrent calls.
+
+    Example
+    -------
+    ::
+
+        age_menu = TextMenu(retry_parse_fail=True).add_question(question='How old are you?', parser=int)
+
+        @bot.command()
+        async def age(ctx):
+            answers = await age_menu.call(ctx)
+
     """
     def __init__(self, *,
                  lock: Union[discord.Member, discord.Role, bool, None] = True,
@@ -436,14 +958,19 @@ class TextMenu:
                  timeout: int = 60,
                  cleanup: bool = False,
                  retry_parse_fail: bool = False,
+                 batch: bool = False,
+                 delimiter: Optional[str] = None,
+                 on_cleanup: Optional[Callable[[CleanupReport], Any]] = None,
                  ):
-        self._questions: List[_QuestionData] = []
-        self._messages = []
+        self._questions: Tuple[_QuestionData, ...] = ()
         self.lock = lock
         self.stop = stop
         self.timeout = timeout
         self.cleanup = cleanup
         self.retry_parse_fail = retry_parse_fail
+        self.batch = batch
+        self.delimiter = delimiter
+        self.on_cleanup = on_cleanup
 
     def add_question(self,
                      *,
@@ -485,48 +1012,9 @@ class TextMenu:
                           parser=parser,
                           parse_fail_response=parse_fail_response,
                           parse_fail_embed=parse_fail_embed)
-        self._questions.append(q)
+        self._questions += (q,)
         return self
 
-    async def _try_to_clean(self, ctx: Context):
-        """
-        Tries to clean up messages excepting errors silently
-        """
-        if self.cleanup:
-            try:
-                await ctx.channel.delete_messages(self._messages)
-            except:
-                pass
-
-    async def _ask(self, ctx, question: _QuestionData):
-        """Asks an individual question"""
-        check = BaseLock(ctx, lock=self.lock)
-        msg_text = question.question if not question.failed else question.parse_fail_response
-        msg_embed = question.embed if not question.failed else question.parse_fail_embed
-        self._messages.append(await ctx.send(content=msg_text, embed=msg_embed))
-        answer_msg = await ctx.bot.wait_for('message', check=check, timeout=self.timeout)
-        self._messages.append(answer_msg)
-        if answer_msg.content.lower().strip() == self.stop:
-            return False
-        if question.parser:
-            try:
-                if isinstance(question.parser, Converter):
-                    answer = await question.parser.convert(ctx, answer_msg.content)
-                elif isinstance(question.parser, type) and issubclass(question.parser, Converter):
-                    answer = await question.parser().convert(ctx, answer_msg.content)
-                else:
-                    answer = question.parser(answer_msg.content)
-                    if isawaitable(question.parser):
-                        answer = await answer
-            except Exception as e:
-                question.failed = True
-                question.parse_fail_response = (question.parse_fail_response.format(answer_msg.content)
-                                                if question.parse_fail_response else None)
-                raise UserAnswerParsingError(f"Failed to parse {question}") from e
-        else:
-            answer = answer_msg.content
-        return answer
-
     async def call(self, ctx: commands.Context):
         """Activates the menu
 
@@ -547,23 +1035,7 @@ class TextMenu:
             :class:`Any`
                 This menu will raise any exception derived from parsers
         """
-        answers = []
-        for question in self._questions:
-            answer = None
-            while answer is None:
-                try:
-                    answer = await self._ask(ctx, question)
-                    if answer is False:
-                        await self._try_to_clean(ctx)
-                        return answer
-                except asyncio.TimeoutError:
-                    await self._try_to_clean(ctx)
-                    return
-                except UserAnswerParsingError as error:
-                    if not self.retry_parse_fail:
-                        await self._try_to_clean(ctx)
-                        raise error
-            answers.append(answer)
-
-        await self._try_to_clean(ctx)
-        return answers
+        session = _TextMenuSession(self, ctx)
+        if self.batch:
+            return await session.run_batch()
+        return await session.run()
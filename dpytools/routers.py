@@ -0,0 +1,443 @@
+# -*- coding: utf-8 -*-
+"""
+Routers that share a single gateway listener between every pending menu or waiter.
+
+Each call to `bot.wait_for` adds a listener whose check runs on every dispatched event,
+so the cost of a single event grows with the amount of open menus.
+The routers in this module register one listener per bot and hand each event
+only to the sessions that are waiting for it using a dictionary lookup.
+"""
+
+import asyncio
+import weakref
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+import discord
+from discord.ext import commands
+
+from dpytools.timers import TimerWheel
+
+__all__ = (
+    'ReactionRouter',
+    'ReactionSession',
+    'MessageRouter',
+)
+
+
+class _Waiter:
+    """This class is not intended to be instantiated or subclassed"""
+    __slots__ = ('future', 'check')
+
+    def __init__(self, future: asyncio.Future, check: Optional[Callable]):
+        self.future = future
+        self.check = check
+
+    def expire(self):
+        if not self.future.done():
+            self.future.set_exception(asyncio.TimeoutError())
+
+
+async def _wait(wheel: TimerWheel, waiter: _Waiter, timeout: Optional[float]):
+    """Awaits the future of the waiter with its timeout scheduled in the wheel"""
+    if timeout is None:
+        return await waiter.future
+    timer = wheel.schedule(timeout, waiter.expire)
+    try:
+        return await waiter.future
+    finally:
+        timer.cancel()
+
+
+class ReactionSession:
+    """
+    A subscription to the reactions of a message that lasts for several interactions.
+
+    Reactions that pass the check are buffered until :meth:`next` retrieves them,
+    so none are lost while the menu is busy editing its message.
+    The idle timeout is a single :class:`dpytools.timers.Timer` that's reset on every reaction
+    instead of a new timeout per wait.
+
+    Once it times out the session is over, later reactions are ignored.
+
+    Created by :meth:`ReactionRouter.session`, it can be used as an async context manager to close it.
+    """
+    __slots__ = ('router', 'message_id', 'check', 'timeout', '_buffer', '_future', '_timer', '_expired')
+
+    def __init__(self,
+                 router: 'ReactionRouter',
+                 message_id: int,
+                 check: Optional[Callable[[discord.RawReactionActionEvent], bool]],
+                 timeout: Optional[float]):
+        self.router = router
+        self.message_id = message_id
+        self.check = check
+        self.timeout = timeout
+        self._buffer = deque()
+        self._future: Optional[asyncio.Future] = None
+        self._expired = False
+        self._timer = None if timeout is None else router._wheel.schedule(timeout, self._expire)
+
+    def _feed(self, payload: discord.RawReactionActionEvent):
+        if self._expired:
+            return  # the session is over, a reaction must not restart its timer
+        try:
+            passed = self.check is None or self.check(payload)
+        except Exception as error:
+            passed, payload = True, error
+        if not passed:
+            return
+        if self._timer is not None and not isinstance(payload, Exception):
+            self._timer.reset(self.timeout)
+        if self._future is not None and not self._future.done():
+            if isinstance(payload, Exception):
+                self._future.set_exception(payload)
+            else:
+                self._future.set_result(payload)
+        else:
+            self._buffer.append(payload)
+
+    def _expire(self):
+        self._expired = True
+        if self._future is not None and not self._future.done():
+            self._future.set_exception(asyncio.TimeoutError())
+
+    async def next(self) -> discord.RawReactionActionEvent:
+        """
+        Returns the next reaction that passed the check
+
+        Raises
+        ------
+        :class:`asyncio.TimeoutError`
+            If no reaction passed the check for **timeout** seconds
+        """
+        if self._buffer:
+            item = self._buffer.popleft()
+            if isinstance(item, Exception):
+                raise item
+            return item
+        if self._expired:
+            raise asyncio.TimeoutError()
+        self._future = asyncio.get_running_loop().create_future()
+        try:
+            return await self._future
+        finally:
+            self._future = None
+
+    def close(self):
+        """Stops listening and cancels the idle timer"""
+        if self._timer is not None:
+            self._timer.cancel()
+        self.router._remove_session(self)
+
+    async def __aenter__(self) -> 'ReactionSession':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+
+class ReactionRouter:
+    """
+    Dispatches **raw_reaction_add** events to the menus waiting on each message.
+
+    There's a single router per bot, retrieve it with :meth:`ReactionRouter.of`.
+    The first time it's retrieved it registers its listener on the bot.
+
+    Example
+    -------
+    ::
+
+        from dpytools.routers import ReactionRouter
+        @bot.command()
+        async def test(ctx):
+            msg = await ctx.send('React to this message')
+            router = ReactionRouter.of(ctx.bot)
+            payload = await router.wait_for(msg.id, check=lambda p: p.user_id == ctx.author.id, timeout=30)
+    """
+    _routers = weakref.WeakKeyDictionary()
+
+    def __init__(self, bot: commands.Bot):
+        self._bot = weakref.ref(bot)
+        self._waiters: Dict[int, List[_Waiter]] = {}
+        self._sessions: Dict[int, List[ReactionSession]] = {}
+        self._wheel = TimerWheel.of(bot)
+        bot.add_listener(self._on_raw_reaction_add, 'on_raw_reaction_add')
+
+    @classmethod
+    def of(cls, bot: commands.Bot) -> 'ReactionRouter':
+        """
+        Returns the router of the bot, creating it if it doesn't exist yet.
+
+        Parameters
+        ----------
+        bot: :class:`discord.ext.commands.Bot`
+            The bot to route reactions for.
+        """
+        router = cls._routers.get(bot)
+        if router is None:
+            router = cls._routers[bot] = cls(bot)
+        return router
+
+    def __len__(self):
+        """The amount of messages with pending waiters or open sessions"""
+        return len(self._waiters.keys() | self._sessions.keys())
+
+    async def _on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
+        if sessions := self._sessions.get(payload.message_id):
+            for session in tuple(sessions):
+                session._feed(payload)
+        waiters = self._waiters.get(payload.message_id)
+        if not waiters:
+            return
+        for waiter in tuple(waiters):
+            if waiter.future.done():
+                continue
+            try:
+                passed = waiter.check is None or waiter.check(payload)
+            except Exception as error:
+                waiter.future.set_exception(error)
+                self._discard(payload.message_id, waiter)
+            else:
+                if passed:
+                    waiter.future.set_result(payload)
+                    self._discard(payload.message_id, waiter)
+
+    def _discard(self, message_id: int, waiter: _Waiter):
+        waiters = self._waiters.get(message_id)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            pass
+        if not waiters:
+            del self._waiters[message_id]
+
+    async def wait_for(self,
+                       message_id: int,
+                       check: Optional[Callable[[discord.RawReactionActionEvent], bool]] = None,
+                       timeout: Optional[float] = None,
+                       ) -> discord.RawReactionActionEvent:
+        """
+        Waits for a reaction added to the message with id **message_id**
+
+        Parameters
+        ----------
+        message_id: :class:`int`
+            The id of the message to listen to.
+            Only reactions to this message will reach **check**.
+        check: :class:`Optional[Callable[[discord.RawReactionActionEvent], bool]]`
+            Optional predicate that receives the payload.
+            Message id is already matched so there's no need to check it here.
+        timeout: :class:`Optional[float]` (seconds)
+            Time to wait before raising :class:`asyncio.TimeoutError`
+
+        Returns
+        -------
+        :class:`discord.RawReactionActionEvent`
+            The payload of the reaction
+
+        Raises
+        ------
+        :class:`asyncio.TimeoutError`
+            If timeout is reached
+        """
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), check)
+        self._waiters.setdefault(message_id, []).append(waiter)
+        try:
+            return await _wait(self._wheel, waiter, timeout)
+        finally:
+            self._discard(message_id, waiter)
+
+    def session(self,
+                message_id: int,
+                check: Optional[Callable[[discord.RawReactionActionEvent], bool]] = None,
+                timeout: Optional[float] = None,
+                ) -> ReactionSession:
+        """
+        Opens a :class:`ReactionSession` on the message with id **message_id**
+
+        Parameters
+        ----------
+        message_id: :class:`int`
+            The id of the message to listen to.
+        check: :class:`Optional[Callable[[discord.RawReactionActionEvent], bool]]`
+            Optional predicate that receives the payload.
+        timeout: :class:`Optional[float]` (seconds)
+            Idle time before :meth:`ReactionSession.next` raises :class:`asyncio.TimeoutError`.
+            It's reset each time a reaction passes the check.
+
+        Example
+        -------
+        ::
+
+            async with ReactionRouter.of(ctx.bot).session(msg.id, check, timeout=30) as session:
+                while True:
+                    payload = await session.next()
+        """
+        session = ReactionSession(self, message_id, check, timeout)
+        self._sessions.setdefault(message_id, []).append(session)
+        return session
+
+    def _remove_session(self, session: ReactionSession):
+        sessions = self._sessions.get(session.message_id)
+        if sessions is None:
+            return
+        try:
+            sessions.remove(session)
+        except ValueError:
+            pass
+        if not sessions:
+            del self._sessions[session.message_id]
+
+    def close(self):
+        """Unregisters the listener, cancels every pending waiter and ends every open session as if it timed out"""
+        bot = self._bot()
+        if bot is not None:
+            bot.remove_listener(self._on_raw_reaction_add, 'on_raw_reaction_add')
+            self._routers.pop(bot, None)
+        for waiters in self._waiters.values():
+            for waiter in waiters:
+                waiter.future.cancel()
+        self._waiters.clear()
+        for sessions in self._sessions.values():
+            for session in sessions:
+                if session._timer is not None:
+                    session._timer.cancel()
+                session._expire()
+        self._sessions.clear()
+
+
+class MessageRouter:
+    """
+    Dispatches **message** events to the waiters of the channel and author of each message.
+
+    Waiters bound to an author are indexed by `(channel_id, author_id)`.
+    Waiters that accept messages from several authors (role locks or no lock at all)
+    go into a bucket for their channel.
+    On each message only those two buckets are visited, regardless of how many waiters are pending elsewhere.
+
+    There's a single router per bot, retrieve it with :meth:`MessageRouter.of`.
+    The functions in :mod:`dpytools.waiters` and :class:`dpytools.menus.TextMenu` already wait through it.
+    """
+    _routers = weakref.WeakKeyDictionary()
+
+    def __init__(self, bot: commands.Bot):
+        self._bot = weakref.ref(bot)
+        self._authors: Dict[Tuple[int, int], List[_Waiter]] = {}
+        self._channels: Dict[int, List[_Waiter]] = {}
+        self._wheel = TimerWheel.of(bot)
+        bot.add_listener(self._on_message, 'on_message')
+
+    @classmethod
+    def of(cls, bot: commands.Bot) -> 'MessageRouter':
+        """
+        Returns the router of the bot, creating it if it doesn't exist yet.
+
+        Parameters
+        ----------
+        bot: :class:`discord.ext.commands.Bot`
+            The bot to route messages for.
+        """
+        router = cls._routers.get(bot)
+        if router is None:
+            router = cls._routers[bot] = cls(bot)
+        return router
+
+    def __len__(self):
+        """The amount of pending waiters"""
+        return (sum(len(waiters) for waiters in self._authors.values())
+                + sum(len(waiters) for waiters in self._channels.values()))
+
+    async def _on_message(self, message: discord.Message):
+        channel_id = message.channel.id
+        if self._authors:
+            key = (channel_id, message.author.id)
+            if waiters := self._authors.get(key):
+                self._resolve(self._authors, key, waiters, message)
+        if waiters := self._channels.get(channel_id):
+            self._resolve(self._channels, channel_id, waiters, message)
+
+    @staticmethod
+    def _resolve(index: dict, key, waiters: List[_Waiter], message: discord.Message):
+        for waiter in tuple(waiters):
+            if waiter.future.done():
+                continue
+            try:
+                passed = waiter.check is None or waiter.check(message)
+            except Exception as error:
+                waiter.future.set_exception(error)
+                waiters.remove(waiter)
+            else:
+                if passed:
+                    waiter.future.set_result(message)
+                    waiters.remove(waiter)
+        if not waiters:
+            index.pop(key, None)
+
+    @staticmethod
+    def _discard(index: dict, key, waiter: _Waiter):
+        waiters = index.get(key)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            pass
+        if not waiters:
+            del index[key]
+
+    async def wait_for(self,
+                       channel_id: int,
+                       author_id: Optional[int] = None,
+                       check: Optional[Callable[[discord.Message], bool]] = None,
+                       timeout: Optional[float] = None,
+                       ) -> discord.Message:
+        """
+        Waits for a message in the channel with id **channel_id**
+
+        Parameters
+        ----------
+        channel_id: :class:`int`
+            The id of the channel to listen to.
+        author_id: :class:`Optional[int]`
+            If passed only messages from this author will reach **check**.
+            Leave it as None for role locked or unlocked waiters.
+        check: :class:`Optional[Callable[[discord.Message], bool]]`
+            Optional predicate that receives the message, :class:`dpytools.waiters.BaseLock` instances work here.
+        timeout: :class:`Optional[float]` (seconds)
+            Time to wait before raising :class:`asyncio.TimeoutError`
+
+        Returns
+        -------
+        :class:`discord.Message`
+            The message that passed the check
+
+        Raises
+        ------
+        :class:`asyncio.TimeoutError`
+            If timeout is reached
+        """
+        if author_id is None:
+            index, key = self._channels, channel_id
+        else:
+            index, key = self._authors, (channel_id, author_id)
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), check)
+        index.setdefault(key, []).append(waiter)
+        try:
+            return await _wait(self._wheel, waiter, timeout)
+        finally:
+            self._discard(index, key, waiter)
+
+    def close(self):
+        """Unregisters the listener and cancels every pending waiter"""
+        bot = self._bot()
+        if bot is not None:
+            bot.remove_listener(self._on_message, 'on_message')
+            self._routers.pop(bot, None)
+        for index in (self._authors, self._channels):
+            for waiters in index.values():
+                for waiter in waiters:
+                    waiter.future.cancel()
+            index.clear()
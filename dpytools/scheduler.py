@@ -0,0 +1,486 @@
+# -*- coding: utf-8 -*-
+"""
+Coordinates the REST calls made by menus so many concurrent menus in a channel don't stall behind rate limits.
+
+Every operation goes through a per channel queue for its rate limit bucket.
+Pending edits to a message are merged into the newest one, reaction calls are paced to the reaction bucket
+and user visible operations (send, edit, delete) go before cosmetic ones (reactions) when the bot wide limit is hit.
+When discord answers with a 429 the queue is paused for the time in the bucket headers
+and the operation is retried.
+
+The scheduler doesn't read the bucket headers of successful responses, pacing by them is left to discord.py
+which already waits on exhausted buckets and retries 429 responses internally.
+Only the 429s that reach the scheduler, after discord.py gave up or from other clients like :class:`FakeHTTP`,
+pause a lane.
+
+The module also includes :class:`FakeHTTP`, a stand in for discord's API that simulates latency and rate limits
+so throughput can be measured offline.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+import weakref
+from typing import Any, Callable, Awaitable, Dict, List, Optional, Tuple
+
+import discord
+from discord.ext import commands
+
+__all__ = (
+    'RESTScheduler',
+    'FakeHTTP',
+)
+
+VISIBLE = 0
+COSMETIC = 1
+
+# operations of these kinds share a rate limit bucket on discord's side
+_ROUTES = {
+    'send': 'send',
+    'edit': 'edit',
+    'delete': 'delete',
+    'bulk_delete': 'bulk_delete',
+    'reaction': 'reaction',
+    'clear': 'reaction',
+}
+
+
+class _Operation:
+    """This class is not intended to be instantiated or subclassed"""
+    __slots__ = ('priority', 'seq', 'kind', 'message_id', 'call', 'kwargs', 'futures')
+
+    def __init__(self, priority: int, seq: int, kind: str, message_id: Optional[int],
+                 call: Callable[..., Awaitable[Any]], kwargs: dict):
+        self.priority = priority
+        self.seq = seq
+        self.kind = kind
+        self.message_id = message_id
+        self.call = call
+        self.kwargs = kwargs
+        self.futures: List[asyncio.Future] = []
+
+    def __lt__(self, other: '_Operation'):
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+    def resolve(self, result: Any = None, error: Optional[BaseException] = None):
+        for future in self.futures:
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+
+def _retry_after(error: discord.HTTPException) -> float:
+    """Reads the time to wait from the headers of a 429 response"""
+    headers = getattr(error.response, 'headers', None) or {}
+    for header in ('Retry-After', 'X-RateLimit-Reset-After'):
+        try:
+            return float(headers[header])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return 1.0
+
+
+class _GlobalLimiter:
+    """
+    Token bucket for the bot wide request limit.
+    When tokens run out waiters are served by priority so user visible operations go first.
+    This class is not intended to be instantiated or subclassed
+    """
+    __slots__ = ('rate', 'tokens', 'updated', 'waiters', '_handle')
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated: Optional[float] = None
+        self.waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    def _refill(self, now: float):
+        if self.updated is not None:
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, priority: int, seq: int):
+        loop = asyncio.get_running_loop()
+        self._refill(loop.time())
+        if self.tokens >= 1 and not self.waiters:
+            self.tokens -= 1
+            return
+        future = loop.create_future()
+        heapq.heappush(self.waiters, (priority, seq, future))
+        if self._handle is None:
+            self._release()
+        await future
+
+    def _release(self):
+        loop = asyncio.get_running_loop()
+        self._handle = None
+        self._refill(loop.time())
+        while self.waiters and self.tokens >= 1:
+            *_, future = heapq.heappop(self.waiters)
+            if not future.done():
+                self.tokens -= 1
+                future.set_result(None)
+        if self.waiters and self._handle is None:
+            self._handle = loop.call_later((1 - self.tokens) / self.rate, self._release)
+
+
+class _Lane:
+    """
+    Queue of the operations of a channel that share a rate limit bucket, run one at a time.
+    This class is not intended to be instantiated or subclassed
+    """
+    __slots__ = ('scheduler', 'key', 'heap', 'interval', 'paused_until', 'last_call', 'wakeup', 'worker')
+
+    def __init__(self, scheduler: 'RESTScheduler', key: Tuple[int, str], interval: float):
+        self.scheduler = scheduler
+        self.key = key
+        self.heap: List[_Operation] = []
+        self.interval = interval
+        self.paused_until = 0.0
+        self.last_call = float('-inf')
+        self.wakeup = asyncio.Event()
+        self.worker: Optional[asyncio.Task] = None
+
+    def push(self, operation: _Operation):
+        heapq.heappush(self.heap, operation)
+        self.wakeup.set()
+        if self.worker is None or self.worker.done():
+            self.worker = asyncio.ensure_future(self._work())
+
+    def drop(self, message_id: int, kinds: Tuple[str, ...]):
+        """Resolves and removes the pending operations of a message that became pointless"""
+        kept = []
+        for operation in self.heap:
+            if operation.message_id == message_id and operation.kind in kinds:
+                operation.resolve(None)
+                self.scheduler.dropped += 1
+            else:
+                kept.append(operation)
+        if len(kept) != len(self.heap):
+            heapq.heapify(kept)
+            self.heap = kept
+
+    async def _work(self):
+        loop = asyncio.get_running_loop()
+        scheduler = self.scheduler
+        while self.heap:
+            delay = max(self.paused_until, self.last_call + self.interval) - loop.time()
+            if delay > 0:
+                self.wakeup.clear()
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            operation = heapq.heappop(self.heap)
+            if operation.kind == 'edit' and scheduler._edits.get(operation.message_id) is operation:
+                del scheduler._edits[operation.message_id]
+            await scheduler._limiter.acquire(operation.priority, operation.seq)
+            self.last_call = loop.time()
+
+            try:
+                result = await operation.call(**operation.kwargs)
+            except discord.HTTPException as error:
+                if error.status == 429:
+                    scheduler.rate_limited += 1
+                    self.paused_until = loop.time() + _retry_after(error)
+                    if operation.kind == 'edit':
+                        pending = scheduler._edits.get(operation.message_id)
+                        if pending is not None:
+                            # a newer edit was queued while this one ran, it takes the place of both
+                            pending.kwargs = {**operation.kwargs, **pending.kwargs}
+                            pending.futures.extend(operation.futures)
+                            scheduler.dropped += 1
+                            continue
+                        scheduler._edits[operation.message_id] = operation
+                    heapq.heappush(self.heap, operation)
+                    continue
+                operation.resolve(error=error)
+            except Exception as error:
+                operation.resolve(error=error)
+            else:
+                scheduler.completed += 1
+                operation.resolve(result)
+
+        # keep the lane while its pacing still matters so a new operation doesn't start from scratch
+        delay = max(self.paused_until, self.last_call + self.interval) - loop.time()
+        if delay > 0:
+            loop.call_later(delay, self._forget)
+        else:
+            self._forget()
+
+    def _forget(self):
+        if not self.heap and self.scheduler._lanes.get(self.key) is self:
+            del self.scheduler._lanes[self.key]
+
+
+class RESTScheduler:
+    """
+    Per channel queues for the REST calls of menus.
+
+    - Each channel has a lane per rate limit bucket (send, edit, delete and reactions), lanes run concurrently.
+    - An edit to a message that still has a pending edit is merged into it, newer keyword arguments win.
+    - Deleting a message drops its pending edits and reactions, clearing reactions drops its pending reactions.
+    - Reaction calls in a channel are spaced by **reaction_interval**.
+    - On a 429 response the lane is paused for the time in the bucket headers and the call is retried,
+      the headers of successful responses are left to discord.py's own bucket handling.
+    - All lanes share a bot wide limit of **global_rate** requests per second,
+      when it's reached user visible operations (send, edit, delete) go before reactions.
+
+    There's a single scheduler per bot, retrieve it with :meth:`RESTScheduler.of`.
+    The menus in :mod:`dpytools.menus` already go through it.
+
+    Parameters
+    ----------
+    reaction_interval: :class:`float` (seconds)
+        Minimum time between reaction calls in the same channel. Defaults to 0.25 which is discord's reaction bucket.
+    global_rate: :class:`float`
+        Maximum requests per second for the whole scheduler. Defaults to 50 which is discord's global limit.
+
+    Attributes
+    ----------
+    completed: :class:`int`
+        Amount of operations that reached discord successfully
+    dropped: :class:`int`
+        Amount of operations skipped because a newer one superseded them
+    rate_limited: :class:`int`
+        Amount of 429 responses received
+    """
+    _schedulers = weakref.WeakKeyDictionary()
+
+    def __init__(self, reaction_interval: float = 0.25, global_rate: float = 50):
+        self.reaction_interval = reaction_interval
+        self._lanes: Dict[Tuple[int, str], _Lane] = {}
+        self._edits: Dict[int, _Operation] = {}
+        self._limiter = _GlobalLimiter(global_rate)
+        self._seq = itertools.count()
+        self.completed = 0
+        self.dropped = 0
+        self.rate_limited = 0
+
+    @classmethod
+    def of(cls, bot: commands.Bot) -> 'RESTScheduler':
+        """
+        Returns the scheduler of the bot, creating it if it doesn't exist yet.
+
+        Parameters
+        ----------
+        bot: :class:`discord.ext.commands.Bot`
+            The bot whose calls will be scheduled.
+        """
+        scheduler = cls._schedulers.get(bot)
+        if scheduler is None:
+            scheduler = cls._schedulers[bot] = cls()
+        return scheduler
+
+    def __len__(self):
+        """The amount of pending operations"""
+        return sum(len(lane.heap) for lane in self._lanes.values())
+
+    def _lane(self, channel_id: int, route: str) -> _Lane:
+        key = (channel_id, route)
+        lane = self._lanes.get(key)
+        if lane is None:
+            interval = self.reaction_interval if route == 'reaction' else 0.0
+            lane = self._lanes[key] = _Lane(self, key, interval)
+        return lane
+
+    def _schedule(self,
+                  channel_id: int,
+                  priority: int,
+                  kind: str,
+                  message_id: Optional[int],
+                  call: Callable[..., Awaitable[Any]],
+                  **kwargs) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+
+        if kind == 'edit' and (pending := self._edits.get(message_id)) is not None:
+            pending.kwargs.update(kwargs)
+            pending.futures.append(future)
+            self.dropped += 1
+            return future
+
+        operation = _Operation(priority, next(self._seq), kind, message_id, call, kwargs)
+        operation.futures.append(future)
+        if kind == 'edit':
+            self._edits[message_id] = operation
+        elif kind == 'delete':
+            if self._edits.pop(message_id, None) is not None:
+                if (lane := self._lanes.get((channel_id, 'edit'))) is not None:
+                    lane.drop(message_id, ('edit',))
+            if (lane := self._lanes.get((channel_id, 'reaction'))) is not None:
+                lane.drop(message_id, ('reaction', 'clear'))
+        elif kind == 'clear':
+            if (lane := self._lanes.get((channel_id, 'reaction'))) is not None:
+                lane.drop(message_id, ('reaction',))
+        self._lane(channel_id, _ROUTES[kind]).push(operation)
+        return future
+
+    async def send(self, channel: discord.abc.Messageable, **kwargs) -> discord.Message:
+        """Sends a message to channel, takes the same keyword arguments as :meth:`discord.abc.Messageable.send`"""
+        if isinstance(channel, commands.Context):
+            channel = channel.channel
+        return await self._schedule(channel.id, VISIBLE, 'send', None, channel.send, **kwargs)
+
+    async def edit(self, message: discord.Message, **kwargs):
+        """Edits a message, pending edits to the same message are merged into this one"""
+        return await self._schedule(message.channel.id, VISIBLE, 'edit', message.id, message.edit, **kwargs)
+
+    async def delete(self, message: discord.Message, **kwargs):
+        """Deletes a message dropping any of its pending operations"""
+        return await self._schedule(message.channel.id, VISIBLE, 'delete', message.id, message.delete, **kwargs)
+
+    async def delete_messages(self, channel: discord.TextChannel, messages: List[discord.Message]):
+        """Deletes up to 100 messages of a guild channel in a single bulk delete"""
+        return await self._schedule(channel.id, COSMETIC, 'bulk_delete', None, channel.delete_messages,
+                                    messages=messages)
+
+    async def add_reaction(self, message: discord.Message, emoji: str):
+        """Adds a reaction to the message"""
+        return await self._schedule(message.channel.id, COSMETIC, 'reaction', message.id,
+                                    message.add_reaction, emoji=emoji)
+
+    async def remove_reaction(self, message: discord.Message, emoji: str, member: discord.abc.Snowflake):
+        """Removes the reaction of member from the message"""
+        return await self._schedule(message.channel.id, COSMETIC, 'reaction', message.id,
+                                    message.remove_reaction, emoji=emoji, member=member)
+
+    async def clear_reactions(self, message: discord.Message):
+        """Clears every reaction of the message dropping its pending reaction operations"""
+        return await self._schedule(message.channel.id, COSMETIC, 'clear', message.id, message.clear_reactions)
+
+
+class _FakeResponse:
+    """This class is not intended to be instantiated or subclassed"""
+
+    def __init__(self, status: int, reason: str, headers: Dict[str, str]):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+
+
+class FakeHTTP:
+    """
+    Offline stand in for discord's API to benchmark menus and :class:`RESTScheduler`.
+
+    It creates fake channels whose messages support the calls menus make.
+    Each call takes **latency** seconds and is counted against a per channel bucket of its route,
+    calls over the bucket's limit fail with a 429 :class:`discord.HTTPException` carrying the usual headers.
+
+    Parameters
+    ----------
+    latency: :class:`float` (seconds)
+        Time each call takes.
+    limits: :class:`Optional[Dict[str, Tuple[int, float]]]`
+        Maps the routes 'send', 'edit', 'delete' and 'reaction' to (calls, per seconds).
+        Defaults to discord's documented per channel limits.
+
+    Attributes
+    ----------
+    requests: :class:`int`
+        Amount of calls that succeeded
+    rate_limited: :class:`int`
+        Amount of calls answered with 429
+
+    Example
+    -------
+    ::
+
+        from dpytools.scheduler import FakeHTTP, RESTScheduler
+        http = FakeHTTP(latency=0.05)
+        channel = http.channel()
+        scheduler = RESTScheduler()
+        msg = await scheduler.send(channel, content='menu')
+        await asyncio.gather(*(scheduler.add_reaction(msg, e) for e in '123456'))
+        print(http.requests, http.rate_limited)
+    """
+    DEFAULT_LIMITS = {
+        'send': (5, 5.0),
+        'edit': (5, 5.0),
+        'delete': (5, 1.0),
+        'reaction': (1, 0.25),
+    }
+
+    def __init__(self, latency: float = 0.05, limits: Optional[Dict[str, Tuple[int, float]]] = None):
+        self.latency = latency
+        self.limits = {**self.DEFAULT_LIMITS, **(limits or {})}
+        self.requests = 0
+        self.rate_limited = 0
+        self._buckets: Dict[Tuple[str, int], List[float]] = {}
+        self._ids = itertools.count(1)
+
+    def channel(self) -> '_FakeChannel':
+        """Returns a new fake channel"""
+        return _FakeChannel(self, next(self._ids))
+
+    async def request(self, route: str, channel_id: int):
+        """Simulates a call to route in channel, raising 429 if its bucket is exhausted"""
+        await asyncio.sleep(self.latency)
+        limit, per = self.limits[route]
+        now = time.monotonic()
+        calls = self._buckets.setdefault((route, channel_id), [])
+        while calls and calls[0] <= now - per:
+            calls.pop(0)
+        if len(calls) >= limit:
+            self.rate_limited += 1
+            retry_after = round(calls[0] + per - now, 3)
+            headers = {'Retry-After': str(retry_after),
+                       'X-RateLimit-Remaining': '0',
+                       'X-RateLimit-Reset-After': str(retry_after)}
+            raise discord.HTTPException(_FakeResponse(429, 'Too Many Requests', headers),
+                                        {'message': 'You are being rate limited.', 'code': 0})
+        calls.append(now)
+        self.requests += 1
+
+
+class _FakeChannel:
+    """This class is not intended to be instantiated or subclassed"""
+
+    def __init__(self, http: FakeHTTP, channel_id: int):
+        self.http = http
+        self.id = channel_id
+        self.guild = None
+
+    async def send(self, content: Optional[str] = None, **kwargs) -> '_FakeMessage':
+        await self.http.request('send', self.id)
+        return _FakeMessage(self, next(self.http._ids), content, kwargs.get('embed'))
+
+
+class _FakeMessage:
+    """This class is not intended to be instantiated or subclassed"""
+
+    def __init__(self, channel: _FakeChannel, message_id: int, content: Optional[str], embed: Any):
+        self.channel = channel
+        self.id = message_id
+        self.guild = None
+        self.content = content
+        self.embed = embed
+        self.reactions: List[str] = []
+
+    async def edit(self, **kwargs):
+        await self.channel.http.request('edit', self.channel.id)
+        self.content = kwargs.get('content', self.content)
+        self.embed = kwargs.get('embed', self.embed)
+
+    async def delete(self, **kwargs):
+        await self.channel.http.request('delete', self.channel.id)
+
+    async def add_reaction(self, emoji: str):
+        await self.channel.http.request('reaction', self.channel.id)
+        if emoji not in self.reactions:
+            self.reactions.append(emoji)
+
+    async def remove_reaction(self, emoji: str, member: discord.abc.Snowflake):
+        await self.channel.http.request('reaction', self.channel.id)
+        if emoji in self.reactions:
+            self.reactions.remove(emoji)
+
+    async def clear_reactions(self):
+        await self.channel.http.request('reaction', self.channel.id)
+        self.reactions.clear()
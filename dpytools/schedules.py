@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+Recurring opening hours for commands, like "Monday to Friday from 09:00 to 17:00 in the guild's timezone".
+
+A :class:`Schedule` is compiled into a sorted list of UTC intervals covering the next weeks,
+with daylight saving time and closed days already applied.
+Checking a moment is a binary search over that list, no timezone conversion happens per call.
+A :class:`ScheduleStore` holds a schedule per guild and can be updated while the bot runs.
+"""
+
+import bisect
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # python 3.8
+    ZoneInfo = None
+
+__all__ = (
+    'Schedule',
+    'ScheduleStore',
+)
+
+_DAYS = ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')
+
+Window = Tuple[Union[str, Iterable[int]], time, time]
+Closure = Union[date, Tuple[datetime, datetime]]
+
+
+def _parse_days(days: Union[str, Iterable[int]]) -> frozenset:
+    """'mon-fri', 'sat,sun' or an iterable of weekdays where monday is 0"""
+    if not isinstance(days, str):
+        return frozenset(int(d) for d in days)
+    parsed = set()
+    for part in days.lower().replace(' ', '').split(','):
+        first, _, last = part.partition('-')
+        start = _DAYS.index(first[:3])
+        end = _DAYS.index(last[:3]) if last else start
+        parsed.update(d % 7 for d in range(start, start + (end - start) % 7 + 1))
+    return frozenset(parsed)
+
+
+def _resolve_tz(tz: Union[str, tzinfo, None]) -> tzinfo:
+    if tz is None:
+        return timezone.utc
+    if isinstance(tz, str):
+        if tz.upper() == 'UTC':
+            return timezone.utc
+        if ZoneInfo is None:
+            raise TypeError('Timezone names require python 3.9+, pass a tzinfo instance instead')
+        return ZoneInfo(tz)
+    return tz
+
+
+def _timestamp(value: datetime) -> float:
+    """Naive datetimes are UTC, like discord.py's created_at"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class Schedule:
+    """
+    Weekly opening windows in a timezone, with optional closures such as holidays.
+
+    Parameters
+    ----------
+    windows: :class:`Iterable[Tuple[Union[str, Iterable[int]], datetime.time, datetime.time]]`
+        Tuples of `(days, start, end)`. Days is a string like **'mon-fri'** or **'sat,sun'**,
+        or weekday numbers where monday is 0. If end is earlier than start the window ends the next day.
+    tz: :class:`Union[str, datetime.tzinfo, None]`
+        Timezone of the windows, an IANA name (python 3.9+) or a tzinfo instance. Defaults to UTC.
+    closures: :class:`Iterable[Union[datetime.date, Tuple[datetime.datetime, datetime.datetime]]]`
+        Whole local days, or ranges of datetimes, during which the schedule is closed.
+    horizon: :class:`int` (days)
+        How many days ahead are compiled at once, the index is rebuilt when a check goes past it.
+
+    Example
+    -------
+    ::
+
+        from datetime import date, time
+        from dpytools.schedules import Schedule
+
+        office = Schedule([('mon-fri', time(9), time(17))],
+                          tz='Europe/Madrid',
+                          closures=[date(2021, 12, 25)])
+        office.is_open(ctx.message.created_at)
+    """
+    __slots__ = ('windows', 'tz', 'closures', 'horizon', '_starts', '_ends', '_valid_from', '_valid_to')
+
+    def __init__(self,
+                 windows: Iterable[Window],
+                 tz: Union[str, tzinfo, None] = None,
+                 closures: Iterable[Closure] = (),
+                 horizon: int = 28):
+        self.tz = _resolve_tz(tz)
+        self.windows = tuple((_parse_days(days), start, end) for days, start, end in windows)
+        for days, start, end in self.windows:
+            if not all(0 <= d <= 6 for d in days):
+                raise ValueError('Weekdays must be between 0 (monday) and 6 (sunday)')
+            if not isinstance(start, time) or not isinstance(end, time):
+                raise TypeError('Window start and end must be datetime.time instances')
+        self.closures = tuple(closures)
+        self.horizon = horizon
+        self._starts: List[float] = []
+        self._ends: List[float] = []
+        self._valid_from = self._valid_to = 0.0
+
+    def _localize(self, day: date, moment: time) -> float:
+        naive = datetime.combine(day, moment)
+        localize = getattr(self.tz, 'localize', None)  # pytz timezones
+        return (localize(naive) if localize else naive.replace(tzinfo=self.tz)).timestamp()
+
+    def _closed_intervals(self) -> List[Tuple[float, float]]:
+        closed = []
+        for closure in self.closures:
+            if isinstance(closure, datetime):
+                raise TypeError('Closures must be dates or (datetime, datetime) tuples')
+            if isinstance(closure, date):
+                closed.append((self._localize(closure, time()),
+                               self._localize(closure + timedelta(days=1), time())))
+            else:
+                start, end = closure
+                if start.tzinfo is None:
+                    start_ts = self._localize(start.date(), start.time())
+                    end_ts = self._localize(end.date(), end.time())
+                else:
+                    start_ts, end_ts = start.timestamp(), end.timestamp()
+                closed.append((start_ts, end_ts))
+        return sorted(closed)
+
+    def compile(self, around: float):
+        """Builds the interval index for the days around the timestamp **around**"""
+        first = datetime.fromtimestamp(around, self.tz).date() - timedelta(days=1)
+        intervals = []
+        for offset in range(self.horizon + 2):
+            day = first + timedelta(days=offset)
+            for days, start, end in self.windows:
+                if day.weekday() in days:
+                    end_day = day if end > start else day + timedelta(days=1)
+                    intervals.append((self._localize(day, start), self._localize(end_day, end)))
+        intervals.sort()
+
+        merged: List[List[float]] = []
+        for start, end in intervals:
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        for closed_start, closed_end in self._closed_intervals():
+            remaining = []
+            for start, end in merged:
+                if end <= closed_start or start >= closed_end:
+                    remaining.append([start, end])
+                    continue
+                if start < closed_start:
+                    remaining.append([start, closed_start])
+                if end > closed_end:
+                    remaining.append([closed_end, end])
+            merged = remaining
+
+        self._starts = [start for start, _ in merged]
+        self._ends = [end for _, end in merged]
+        self._valid_from = self._localize(first + timedelta(days=1), time())
+        self._valid_to = self._localize(first + timedelta(days=self.horizon), time())
+
+    def is_open(self, moment: datetime) -> bool:
+        """
+        Whether **moment** falls inside a window and outside every closure.
+
+        Parameters
+        ----------
+        moment: :class:`datetime.datetime`
+            Aware, or naive in UTC like `message.created_at`.
+        """
+        ts = _timestamp(moment)
+        if not self._valid_from <= ts < self._valid_to:
+            self.compile(ts)
+        i = bisect.bisect_right(self._starts, ts) - 1
+        return i >= 0 and ts < self._ends[i]
+
+    def __repr__(self):
+        return f"Schedule(windows={len(self.windows)}, tz={self.tz}, closures={len(self.closures)})"
+
+
+class ScheduleStore:
+    """
+    Schedules by guild id that can be replaced while the bot runs, see :func:`dpytools.checks.within_schedule`.
+
+    :meth:`load` swaps the whole mapping at once, commands never see a partially updated store.
+
+    Parameters
+    ----------
+    schedules: :class:`Optional[Dict[int, Schedule]]`
+        Initial schedules by guild id.
+    default: :class:`Optional[Schedule]`
+        Schedule of guilds without their own, None leaves them always open.
+    """
+
+    def __init__(self, schedules: Optional[Dict[int, Schedule]] = None, default: Optional[Schedule] = None):
+        self._schedules: Dict[int, Schedule] = dict(schedules or {})
+        self.default = default
+
+    def get(self, guild_id: Optional[int]) -> Optional[Schedule]:
+        """Returns the schedule of the guild or the default"""
+        return self._schedules.get(guild_id, self.default)
+
+    def set(self, guild_id: int, schedule: Optional[Schedule]):
+        """Sets or removes (with None) the schedule of a guild"""
+        if schedule is None:
+            self._schedules.pop(guild_id, None)
+        else:
+            self._schedules[guild_id] = schedule
+
+    def load(self, schedules: Dict[int, Schedule]):
+        """Replaces every schedule, for example after reading them from a database"""
+        self._schedules = dict(schedules)
+
+    def __len__(self):
+        return len(self._schedules)
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""
+A hierarchical timer wheel shared by menu and waiter sessions for their idle timeouts.
+
+Each `asyncio.wait_for(..., timeout=...)` creates its own timer handle in the event loop's heap,
+and resetting it means cancelling that handle and creating another.
+The wheel keeps every timeout of a bot in buckets advanced by a single periodic callback instead.
+Scheduling, resetting and cancelling are O(1) and timers due on the same tick expire together in a batch.
+"""
+
+import asyncio
+import weakref
+from typing import Callable, List, Optional, Tuple
+
+from discord.ext import commands
+
+__all__ = (
+    'TimerWheel',
+    'Timer',
+)
+
+
+class Timer:
+    """
+    A timeout scheduled in a :class:`TimerWheel`. Created by :meth:`TimerWheel.schedule`.
+
+    Attributes
+    ----------
+    callback: :class:`Callable[[], Any]`
+        Called without arguments when the timer expires.
+    """
+    __slots__ = ('wheel', 'callback', 'deadline', 'active', 'queued', 'entry')
+
+    def __init__(self, wheel: 'TimerWheel', callback: Callable[[], None]):
+        self.wheel = wheel
+        self.callback = callback
+        self.deadline = 0
+        self.active = False
+        self.queued = False
+        self.entry = 0
+
+    def reset(self, delay: float):
+        """
+        Moves the expiration to **delay** seconds from now.
+        Postponing a timer doesn't move it between buckets, it's relocated when its old bucket is reached.
+        """
+        wheel = self.wheel
+        wheel._wake()
+        deadline = wheel._tick_after(delay)
+        if self.active and self.queued and deadline >= self.deadline:
+            self.deadline = deadline
+            return
+        if not self.active:
+            self.active = True
+            wheel._count += 1
+        self.deadline = deadline
+        wheel._insert(self)
+
+    def cancel(self):
+        """Stops the timer, it's dropped from its bucket when the wheel reaches it"""
+        if self.active:
+            self.active = False
+            self.wheel._count -= 1
+
+    @property
+    def remaining(self) -> float:
+        """Seconds until expiration"""
+        return max(0.0, (self.deadline - self.wheel._tick) * self.wheel.resolution)
+
+
+class TimerWheel:
+    """
+    Hierarchical timer wheel.
+
+    Level 0 has one bucket per tick, each following level covers **slots** times the span of the previous one.
+    Timers far in the future wait in higher levels and cascade down as their time approaches.
+    The wheel only ticks while it has active timers.
+
+    There's a single wheel per bot, retrieve it with :meth:`TimerWheel.of`.
+    :mod:`dpytools.routers` use it for the timeouts of every waiter and menu session.
+
+    Parameters
+    ----------
+    resolution: :class:`float` (seconds)
+        Duration of a tick, timers expire at most this late. Defaults to 0.1
+    slots: :class:`int`
+        Buckets per level. Defaults to 64
+    levels: :class:`int`
+        Amount of levels. With the defaults the wheel spans ~19 days before timers have to be re-inserted.
+    batch_size: :class:`Optional[int]`
+        Maximum amount of timers expired per tick, the rest are carried to the next tick so a burst of
+        expirations is spread out. None (default) expires everything that is due.
+    """
+    _wheels = weakref.WeakKeyDictionary()
+
+    def __init__(self,
+                 resolution: float = 0.1,
+                 slots: int = 64,
+                 levels: int = 4,
+                 batch_size: Optional[int] = None):
+        self.resolution = resolution
+        self.slots = slots
+        self.levels = levels
+        self.batch_size = batch_size
+        self._buckets: List[List[List[Tuple[Timer, int]]]] = [[[] for _ in range(slots)] for _ in range(levels)]
+        self._carry: List[Tuple[Timer, int]] = []
+        self._tick = 0
+        self._started = 0.0
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._count = 0
+
+    @classmethod
+    def of(cls, bot: commands.Bot) -> 'TimerWheel':
+        """
+        Returns the wheel of the bot, creating it if it doesn't exist yet.
+
+        Parameters
+        ----------
+        bot: :class:`discord.ext.commands.Bot`
+            The bot whose sessions will share the wheel.
+        """
+        wheel = cls._wheels.get(bot)
+        if wheel is None:
+            wheel = cls._wheels[bot] = cls()
+        return wheel
+
+    def __len__(self):
+        """The amount of active timers"""
+        return self._count
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> Timer:
+        """
+        Schedules **callback** to be called in **delay** seconds
+
+        Parameters
+        ----------
+        delay: :class:`float` (seconds)
+            Time before the callback is called
+        callback: :class:`Callable[[], Any]`
+            Called without arguments on expiration
+
+        Returns
+        -------
+        :class:`Timer`
+            The timer, which can be reset or cancelled
+        """
+        timer = Timer(self, callback)
+        timer.reset(delay)
+        return timer
+
+    def _wake(self):
+        """An idle wheel doesn't tick, bring its clock up to date without walking the empty buckets"""
+        if self._handle is None:
+            self._started = asyncio.get_running_loop().time() - self._tick * self.resolution
+
+    def _tick_after(self, delay: float) -> int:
+        # never expire early: round up and count the partial tick in progress
+        return self._tick + max(1, -int(-delay // self.resolution)) + 1
+
+    def _insert(self, timer: Timer):
+        timer.entry += 1
+        timer.queued = True
+        delta = timer.deadline - self._tick
+        span = 1
+        for level in range(self.levels):
+            if delta < span * self.slots or level == self.levels - 1:
+                break
+            span *= self.slots
+        self._buckets[level][(timer.deadline // span) % self.slots].append((timer, timer.entry))
+
+        if self._handle is None:
+            loop = asyncio.get_running_loop()
+            self._handle = loop.call_at(self._started + (self._tick + 1) * self.resolution, self._advance)
+
+    def _advance(self):
+        # the handle stays set while advancing so callbacks that schedule timers don't move the clock
+        loop = asyncio.get_running_loop()
+        target = int((loop.time() - self._started) / self.resolution)
+        while self._tick < target and self._count > 0:
+            self._tick += 1
+            self._cascade()
+            self._expire(self._buckets[0][self._tick % self.slots])
+
+        self._handle = None
+        if self._count > 0:
+            self._handle = loop.call_at(self._started + (self._tick + 1) * self.resolution, self._advance)
+
+    def _cascade(self):
+        span = self.slots
+        for level in range(1, self.levels):
+            if self._tick % span:
+                break
+            index = (self._tick // span) % self.slots
+            bucket, self._buckets[level][index] = self._buckets[level][index], []
+            for timer, entry in bucket:
+                if entry == timer.entry and timer.active:
+                    self._insert(timer)
+            span *= self.slots
+
+    def _expire(self, bucket: List[Tuple[Timer, int]]):
+        due = []
+        for timer, entry in self._carry + bucket:
+            if entry != timer.entry or not timer.active:
+                continue  # stale entry of a timer that was cancelled or moved
+            if timer.deadline > self._tick:
+                self._insert(timer)  # postponed after being bucketed
+            else:
+                due.append((timer, entry))
+        bucket.clear()
+
+        if self.batch_size is not None and len(due) > self.batch_size:
+            due, self._carry = due[:self.batch_size], due[self.batch_size:]
+        else:
+            self._carry = []
+
+        for timer, _ in due:
+            timer.active = False
+            timer.queued = False
+            self._count -= 1
+            try:
+                timer.callback()
+            except Exception as error:
+                asyncio.get_running_loop().call_exception_handler({
+                    'message': 'Exception in timer wheel callback',
+                    'exception': error,
+                })
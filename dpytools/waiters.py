@@ -13,6 +13,8 @@ from typing import Union, Optional
 import discord
 from discord.ext import commands
 
+from dpytools.routers import MessageRouter
+
 __all__ = (
     'wait_for_regex',
     'wait_for_author',
@@ -32,6 +34,9 @@ class BaseLock:
 
     The constructor Raises ValueError if channel is not a GuildChannel when lock is type Role.
 
+    Instances can wait for their own message with :meth:`BaseLock.wait`,
+    which goes through the bot's :class:`dpytools.routers.MessageRouter`.
+
     """
 
     def __init__(self,
@@ -49,17 +54,43 @@ class BaseLock:
             raise ValueError(f":lock: parameter is a role but the target channel is not a guild TextChannel")
         self.lock = lock
 
+    @property
+    def author_id(self) -> Optional[int]:
+        """The id of the only author that can pass this lock or None if multiple authors can"""
+        if self.lock is True:
+            return self.ctx.author.id
+        elif isinstance(self.lock, (discord.Member, discord.User)):
+            return self.lock.id
+
     def __call__(self, message: discord.Message) -> bool:
-        checks = [message.channel == self.channel]
+        if message.channel != self.channel:
+            return False
 
         if self.lock is True:
-            checks.append(self.ctx.author == message.author)
+            return self.ctx.author == message.author
         elif isinstance(self.lock, discord.Role):
-            checks.append(self.lock in self.ctx.author.roles)
+            return self.lock in getattr(message.author, 'roles', ())
         elif isinstance(self.lock, (discord.Member, discord.User)):
-            checks.append(self.lock == self.ctx.author)
+            return self.lock.id == message.author.id
+
+        return True
+
+    async def wait(self, timeout: Optional[float] = None) -> discord.Message:
+        """
+        Waits for a message that passes this lock
+
+        Parameters
+        ----------
+        timeout: :class:`Optional[float]` (seconds)
+            Time to wait before raising :class:`asyncio.TimeoutError`
 
-        return all(checks)
+        Returns
+        -------
+        :class:`discord.Message`
+            The first message that passed the lock
+        """
+        router = MessageRouter.of(self.ctx.bot)
+        return await router.wait_for(self.channel.id, self.author_id, check=self, timeout=timeout)
 
 
 async def wait_for_regex(ctx: commands.Context,
@@ -109,7 +140,7 @@ async def wait_for_regex(ctx: commands.Context,
     check = Check(ctx, channel, lock)
 
     try:
-        message = await ctx.bot.wait_for('message', check=check, timeout=timeout)
+        message = await check.wait(timeout)
     except asyncio.TimeoutError:
         return
     else:
@@ -140,7 +171,7 @@ async def wait_for_author(ctx: commands.Context,
         **None** if **timeout** is reached or if **stop** string is passed
     """
     try:
-        message = await ctx.bot.wait_for('message', timeout=timeout, check=BaseLock(ctx))
+        message = await BaseLock(ctx).wait(timeout)
     except asyncio.TimeoutError:
         return
     else:
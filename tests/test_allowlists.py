@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import sqlite3
+
+import pytest
+
+from dpytools.allowlists import SQLiteAllowList, _PollingAllowList
+
+
+def test_polling_allowlist_requires_a_source():
+    class Incomplete(_PollingAllowList):
+        def _read(self):
+            return []
+
+    with pytest.raises(TypeError):
+        Incomplete(interval=1)
+
+
+def test_sqlite_allowlist_stop_close(tmp_path):
+    path = str(tmp_path / 'ids.db')
+    with sqlite3.connect(path) as connection:
+        connection.execute('CREATE TABLE testers (user_id INTEGER)')
+        connection.execute('INSERT INTO testers VALUES (1)')
+    allowlist = SQLiteAllowList(path, 'SELECT user_id FROM testers', interval=0.01)
+
+    async def main():
+        allowlist.start()
+        allowlist.stop()
+        allowlist.start()  # stopping keeps the connection open
+        await allowlist.poll()
+        allowlist.close()
+        with pytest.raises(RuntimeError):
+            allowlist.start()
+
+    asyncio.run(main())
+    assert 1 in allowlist
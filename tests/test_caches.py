@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import types
+
+import discord
+from discord.utils import SnowflakeList
+
+from dpytools.caches import PermissionCache
+
+
+class _Bot:
+    def add_listener(self, func, name):
+        pass
+
+
+class _Member:
+    """Mimics discord.Member, roles are resolved from the raw `_roles` ids"""
+
+    def __init__(self, guild, role_ids):
+        self.id = 42
+        self.guild = guild
+        self._roles = SnowflakeList(role_ids)
+
+    @property
+    def roles(self):
+        return [self.guild.roles[i] for i in self._roles]
+
+    @property
+    def top_role(self):
+        return max(self.roles, key=lambda role: role.position)
+
+    @property
+    def guild_permissions(self):
+        value = 0
+        for role in self.roles:
+            value |= role.permissions.value
+        return discord.Permissions(value)
+
+
+def _guild():
+    guild = types.SimpleNamespace(id=1)
+    guild.roles = {
+        1: types.SimpleNamespace(id=1, position=1, permissions=discord.Permissions(send_messages=True)),
+        2: types.SimpleNamespace(id=2, position=2, permissions=discord.Permissions(ban_members=True)),
+    }
+    return guild
+
+
+def test_revoked_role_is_noticed_without_member_update():
+    cache = PermissionCache(_Bot(), ttl=None)
+    guild = _guild()
+    assert cache.get(_Member(guild, [1, 2])).permissions.ban_members
+    assert cache.get(_Member(guild, [1, 2])).permissions.ban_members
+    assert cache.hits == 1
+
+    # a later message carries the member without the role, no member_update event was received
+    revoked = cache.get(_Member(guild, [1]))
+    assert not revoked.permissions.ban_members
+    assert revoked.roles == frozenset({1})
+
+
+def test_ownership_transfer_drops_the_guild():
+    import asyncio
+
+    cache = PermissionCache(_Bot(), ttl=None)
+    guild = _guild()
+    cache.get(_Member(guild, [1]))
+    before, after = types.SimpleNamespace(id=1, owner_id=42), types.SimpleNamespace(id=1, owner_id=7)
+
+    asyncio.run(cache._on_guild_update(after, after))
+    assert len(cache) == 1
+    asyncio.run(cache._on_guild_update(before, after))
+    assert len(cache) == 0
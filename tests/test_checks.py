@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import types
+
+import pytest
+from discord.ext import commands
+
+from dpytools.checks import any_checks, get_check_stats, CheckStats
+
+
+async def _allow(ctx):
+    return True
+
+
+async def _deny(ctx):
+    return False
+
+
+def _any_checks_predicate(pred):
+    @any_checks
+    @commands.check(lambda ctx: pred(ctx))  # not a coroutine function, but returns a coroutine
+    @commands.command()
+    async def command(ctx):
+        pass
+
+    return command.checks[0]
+
+
+def test_any_checks_awaits_sync_checks_returning_awaitables():
+    ctx = types.SimpleNamespace()
+    assert asyncio.run(_any_checks_predicate(_allow)(ctx)) is True
+    with pytest.raises(commands.CheckFailure):
+        asyncio.run(_any_checks_predicate(_deny)(ctx))
+
+
+def test_check_stats_survive_cog_instantiation():
+    class Cog(commands.Cog):
+        @any_checks(adaptive=True)
+        @commands.check(_deny)
+        @commands.check(_allow)
+        @commands.command()
+        async def command(self, ctx):
+            pass
+
+    cog = Cog()
+    stats = get_check_stats(cog.command)
+    assert isinstance(stats, CheckStats)
+    assert stats is get_check_stats(Cog.command)
+
+    asyncio.run(cog.command.checks[0](types.SimpleNamespace()))
+    assert sum(row['calls'] for row in stats.snapshot()) >= 1
+
+
+def test_get_check_stats_without_adaptive_any_checks():
+    @commands.command()
+    async def command(ctx):
+        pass
+
+    assert get_check_stats(command) is None
+
+
+def test_evaluate_commands_runs_global_and_cog_checks_per_command():
+    from dpytools.checks import evaluate_commands
+
+    class Cog(commands.Cog):
+        def cog_check(self, ctx):
+            return ctx.command.name != 'in_cog_hidden'
+
+        @commands.command()
+        async def in_cog_visible(self, ctx):
+            pass
+
+        @commands.command()
+        async def in_cog_hidden(self, ctx):
+            pass
+
+    async def main():
+        bot = commands.Bot(command_prefix='!')
+        bot.add_check(lambda ctx: ctx.command.name != 'hidden')
+
+        @bot.command()
+        async def visible(ctx):
+            pass
+
+        @bot.command()
+        async def hidden(ctx):
+            pass
+
+        bot.add_cog(Cog())
+        ctx = types.SimpleNamespace(bot=bot, command=None)
+        results = await evaluate_commands(ctx, bot.walk_commands())
+        assert {command.name: ok for command, ok in results.items()} == {
+            'help': True, 'visible': True, 'hidden': False, 'in_cog_visible': True, 'in_cog_hidden': False,
+        }
+        assert ctx.command is None
+
+    asyncio.run(main())
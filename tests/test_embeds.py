@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+import copy
+import pickle
+
+import discord
+import pytest
+
+from dpytools.embeds import DESCRIPTION_LIMIT, Embed, PaginatedEmbeds
+
+
+def _embed():
+    embed = Embed(title='ab', description='d' * 3000, footer={'text': 'foot'}, author={'name': 'me'})
+    embed.add_field(name='name', value='v' * 200)
+    return embed
+
+
+@pytest.mark.parametrize('clone', [
+    copy.copy,
+    copy.deepcopy,
+    lambda embed: pickle.loads(pickle.dumps(embed)),
+])
+def test_size_counters_survive_copies(clone):
+    embed = _embed()
+    cloned = clone(embed)
+    assert len(cloned) == len(embed) == discord.Embed.__len__(embed)
+    assert cloned.validate().violations == embed.validate().violations == {'description': (3000, 2048)}
+
+    cloned.title = 'abc'
+    assert len(cloned) == discord.Embed.__len__(cloned)
+
+
+def test_file_pages_closes_the_file_when_init_fails(tmp_path, monkeypatch):
+    import builtins
+    from dpytools.embeds import FilePages
+
+    path = tmp_path / 'log.txt'
+    path.write_text('line\n' * 100)
+    opened = []
+    real_open = builtins.open
+
+    def tracking_open(*args, **kwargs):
+        file = real_open(*args, **kwargs)
+        opened.append(file)
+        return file
+
+    monkeypatch.setattr(builtins, 'open', tracking_open)
+    with pytest.raises(ValueError):
+        FilePages(str(path), max_size=3, prefix='```', suffix='```')
+    assert opened and all(file.closed for file in opened)
+
+
+@pytest.mark.parametrize('prefix, suffix, max_size', [
+    ('', '', 2000),
+    ('```', '```', 2000),
+    ('```py', '```', 500),
+    (None, None, 300),
+])
+def test_paginate_to_embeds_matches_paginator(prefix, suffix, max_size):
+    from discord.ext.commands import Paginator
+    from dpytools.embeds import paginate_to_embeds
+
+    width = max_size - len(prefix or '') - len(suffix or '') - 2
+    # every length around the page boundaries, including lines of exactly the maximum width
+    lines = ['x' * (i % (width + 1)) for i in range(0, 40 * width, 7)] + ['y' * width] * 5
+    paginator = Paginator(prefix=prefix, suffix=suffix, max_size=max_size)
+    for line in lines:
+        paginator.add_line(line)
+
+    embeds = paginate_to_embeds('\n'.join(lines), max_size=max_size, prefix=prefix, suffix=suffix)
+    assert [embed.description for embed in embeds] == paginator.pages
+    assert all(len(embed.description) <= max_size for embed in embeds)
+
+
+@pytest.mark.parametrize('prefix, suffix, max_size', [('', '', 2000), ('```', '```', 500), (None, None, 300)])
+def test_file_pages_match_paginate_to_embeds(tmp_path, prefix, suffix, max_size):
+    from dpytools.embeds import FilePages, paginate_to_embeds
+
+    width = max_size - len(prefix or '') - len(suffix or '') - 2
+    text = '\n'.join('x' * (i % (width + 3)) for i in range(0, 40 * width, 7))
+    path = tmp_path / 'log.txt'
+    path.write_text(text)
+
+    expected = [embed.description for embed in paginate_to_embeds(text, max_size=max_size, prefix=prefix, suffix=suffix)]
+    with FilePages(str(path), max_size=max_size, prefix=prefix, suffix=suffix) as pages:
+        assert [pages.page_text(i) for i in range(len(pages))] == expected
+
+
+def test_paginated_embeds_count_the_page_number_in_the_description():
+    fields = {str(i): 'v' * 1000 for i in range(5)}
+    marker = len('`Page: 2/2`\n')
+
+    pages = PaginatedEmbeds(Embed(description='d' * (DESCRIPTION_LIMIT - marker)), fields)
+    assert len(pages) == 2
+    assert all(page.validate() for page in pages)
+
+    with pytest.raises(ValueError):
+        PaginatedEmbeds(Embed(description='d' * (DESCRIPTION_LIMIT - marker + 1)), fields)
+    assert len(PaginatedEmbeds(Embed(description='d' * DESCRIPTION_LIMIT), {'a': 'b'})) == 1
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import types
+
+import discord
+
+from dpytools.menus import _PageSource, _QuestionData, _TextMenuSession
+
+
+def _session(delimiter=None, questions=()):
+    return types.SimpleNamespace(menu=types.SimpleNamespace(delimiter=delimiter), questions=list(questions))
+
+
+def test_batch_split_ignores_trailing_empty_answers():
+    assert _TextMenuSession.split(_session(), 'a\nb\n\n') == ['a', 'b']
+    assert _TextMenuSession.split(_session(), 'a\n\nc') == ['a', '', 'c']
+    assert _TextMenuSession.split(_session(delimiter=';'), 'a; b;') == ['a', 'b']
+
+
+def test_batch_prompt_skips_empty_texts():
+    questions = [
+        _QuestionData(embed=discord.Embed(title='Name?')),
+        _QuestionData(embed=discord.Embed().add_field(name='Pick one', value='a, b or c')),
+        _QuestionData(question='Age?', parse_fail_response='{} is not a number'),
+    ]
+    prompt = _TextMenuSession.batch_prompt(_session(questions=questions), [0, 1, 2], {2: 'ten'})
+    assert 'Embed.Empty' not in prompt
+    assert prompt.splitlines()[:3] == ['**1.** Name?', '**2.**', '**3.** Age? (ten is not a number)']
+
+
+def test_async_iterator_pages_are_bounded():
+    async def pages():
+        for i in range(10):
+            yield discord.Embed(description=str(i))
+
+    async def main():
+        source = _PageSource(pages(), cache_size=3)
+        assert (await source.get(5)).description == '5'
+        assert (await source.get(3)).description == '3'
+        assert await source.get(2) is None
+        assert len(source._pulled) == 3
+        assert await source.get(10) is None
+        assert source.count == 10
+
+    asyncio.run(main())
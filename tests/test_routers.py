@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import types
+
+import pytest
+
+from dpytools.routers import ReactionRouter
+
+
+class _Bot:
+    def add_listener(self, func, name):
+        pass
+
+    def remove_listener(self, func, name):
+        pass
+
+
+def _payload(message_id=1):
+    return types.SimpleNamespace(message_id=message_id, user_id=2, emoji=types.SimpleNamespace(name='x'))
+
+
+def test_expired_session_ignores_later_reactions():
+    async def main():
+        router = ReactionRouter(_Bot())
+        session = router.session(1, timeout=0.05)
+        with pytest.raises(asyncio.TimeoutError):
+            await session.next()
+        await router._on_raw_reaction_add(_payload())
+        with pytest.raises(asyncio.TimeoutError):
+            await session.next()
+        assert session._timer is None or not session._timer.active
+        session.close()
+        router.close()
+
+    asyncio.run(main())
+
+
+def test_router_close_ends_open_sessions():
+    async def main():
+        router = ReactionRouter(_Bot())
+        session = router.session(1, timeout=60)
+        pending = asyncio.ensure_future(session.next())
+        await asyncio.sleep(0)
+        router.close()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(pending, 1)
+        assert len(router) == 0
+
+    asyncio.run(main())
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+from dpytools.scheduler import FakeHTTP, RESTScheduler
+
+
+def test_delete_and_clear_create_no_lanes():
+    async def main():
+        http = FakeHTTP(latency=0)
+        scheduler = RESTScheduler()
+        channel = http.channel()
+        first = await scheduler.send(channel, content='menu')
+        second = await scheduler.send(channel, content='menu')
+        await scheduler.delete(first)
+        assert (channel.id, 'edit') not in scheduler._lanes
+        assert (channel.id, 'reaction') not in scheduler._lanes
+        await scheduler.clear_reactions(second)
+        await scheduler.delete(second)
+        assert (channel.id, 'edit') not in scheduler._lanes
+
+    asyncio.run(main())
+
+
+def test_edit_retried_after_429_is_merged():
+    async def main():
+        http = FakeHTTP(latency=0.01, limits={'edit': (1, 0.2)})
+        scheduler = RESTScheduler()
+        msg = await scheduler.send(http.channel(), content='menu')
+        await msg.edit(content='spent the bucket')
+        first = asyncio.ensure_future(scheduler.edit(msg, content='1'))
+        await asyncio.sleep(0.05)  # the first edit got a 429 and waits to be retried
+        second = asyncio.ensure_future(scheduler.edit(msg, content='2'))
+        await asyncio.gather(first, second)
+        assert msg.content == '2'
+        assert http.requests == 3
+        assert scheduler.rate_limited == 1
+        assert not scheduler._edits
+
+    asyncio.run(main())